@@ -11,9 +11,21 @@
 # ]
 # ///
 
+from pathlib import Path
+
 import dash_bootstrap_components as dbc
 from dash import Dash, html, page_container
 
+import dash_aggrid_scales as das
+
+# Pages style their grids at import, and the customize page again each time a
+# dataset is loaded: share the conditions between the gunicorn workers. The
+# cache holds JS that the browser runs, so it lives in a directory only the
+# app's user can write to, not in the shared temporary directory.
+cache_dir = Path(__file__).parent / ".cache"
+cache_dir.mkdir(mode=0o700, exist_ok=True)
+das.enable_cache(backend=das.SQLiteCache(cache_dir / "scales.sqlite", ttl=24 * 3600))
+
 dbc_css = "https://cdn.jsdelivr.net/gh/AnnMarieW/dash-bootstrap-templates/dbc.min.css"
 app = Dash(
     external_stylesheets=[dbc.themes.COSMO, dbc_css, dbc.icons.BOOTSTRAP],
@@ -0,0 +1,65 @@
+"""
+Measure the import time of dash_aggrid_scales with `python -X importtime`.
+
+Exits with a non-zero status if the import takes longer than the budget, or
+if it pulls in any of the modules that should only be loaded on first use.
+
+    python benchmarks/import_time.py --budget-ms 1000
+"""
+
+import argparse
+import subprocess
+import sys
+
+FORBIDDEN = ["plotly", "plotly.express", "plotly.colors"]
+
+
+def import_times(module):
+    """Return {module: (self_us, cumulative_us)} for a fresh import of `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="dash_aggrid_scales")
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(f"{args.module}: {total_ms:.1f} ms (best of {args.repeat})")
+    print("\nSlowest top-level imports:")
+    top_level = {name: t for name, t in best.items() if "." not in name}
+    for name, (_, cumulative) in sorted(
+        top_level.items(), key=lambda item: item[1][1], reverse=True
+    )[:10]:
+        print(f"  {name:<30} {cumulative / 1000:8.1f} ms")
+
+    failures = []
+    loaded = [name for name in FORBIDDEN if name in best]
+    if loaded:
+        failures.append(f"imported eagerly: {', '.join(loaded)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"{total_ms:.1f} ms is over the {args.budget_ms} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
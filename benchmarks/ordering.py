@@ -0,0 +1,62 @@
+"""
+Measure the conditions AG Grid tests per cell, with and without `order="frequency"`.
+
+The evaluation of the conditions in the browser is replayed with `simulate`,
+on skewed data where most values fall in a few bins.
+
+    python benchmarks/ordering.py --rows 100000
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+import dash_aggrid_scales as das
+
+
+def datasets(rows, rng):
+    gapminder = px.data.gapminder()
+    return {
+        "lognormal": pd.Series(rng.lognormal(size=rows)),
+        "lognormal (reversed)": pd.Series(-rng.lognormal(size=rows)),
+        "normal": pd.Series(rng.normal(size=rows)),
+        "beta(5, 1)": pd.Series(rng.beta(5, 1, size=rows) * 100),
+        "gapminder.pop": gapminder["pop"],
+        "gapminder.gdpPercap": gapminder["gdpPercap"],
+    }
+
+
+FUNCTIONS = {
+    "sequential": das.sequential,
+    "diverging": das.diverging,
+    "bar": das.bar,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'data':>20} {'function':>10} {'conditions':>10} "
+        f"{'mean (asc)':>10} {'mean (freq)':>11} {'p99 (asc)':>9} {'p99 (freq)':>10}"
+    )
+    for name, series in datasets(args.rows, rng).items():
+        for function_name, func in FUNCTIONS.items():
+            ascending = das.simulate(func(series), series)
+            frequency = das.simulate(func(series, order="frequency"), series)
+            assert frequency["unstyled"] == ascending["unstyled"]
+            assert sorted(frequency["matches"]) == sorted(ascending["matches"])
+            print(
+                f"{name:>20} {function_name:>10} {ascending['conditions']:>10} "
+                f"{ascending['mean_checks']:>10.2f} {frequency['mean_checks']:>11.2f} "
+                f"{ascending['p99_checks']:>9.0f} {frequency['p99_checks']:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Measure how `style_frame` scales with the number of workers on a wide table.
+
+    python benchmarks/parallel.py --columns 300 --rows 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import dash_aggrid_scales as das
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--columns", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--executor", default="auto")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {f"col_{i}": rng.normal(size=args.rows) for i in range(args.columns)}
+    )
+    spec = [{"field": col, "scale": "sequential"} for col in df] + [
+        {"field": col, "scale": "bar"} for col in df
+    ]
+
+    print(f"{args.columns} columns x {args.rows:,} rows, executor={args.executor}")
+    print(f"{'workers':>8} {'time (s)':>9} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            das.style_frame(df, spec, max_workers=workers, executor=args.executor)
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>9.2f} {baseline / best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark the scale functions across data sizes, cardinalities and dtypes.
+
+For each case, reports the best wall time, the peak memory allocated while
+generating the conditions (tracemalloc), the number of conditions and the
+size of their JSON serialization, which is what is sent to the browser.
+
+    python benchmarks/scales.py --sizes 1e3 1e5 1e7 --ratios 0.001 1
+    python benchmarks/scales.py --functions bar bar_negative --json bar.json
+
+`qualitative` creates one condition per category, so cases with more than
+`--max-categories` distinct values are skipped.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import dash_aggrid_scales as das
+
+DTYPES = ["int", "float", "string", "categorical"]
+NUMERIC = ["int", "float"]
+
+
+def make_series(size, ratio, dtype, negative=False, seed=0):
+    """A Series of `size` values with about `size * ratio` distinct ones."""
+    rng = np.random.default_rng(seed)
+    n_distinct = max(1, int(size * ratio))
+    codes = rng.integers(0, n_distinct, size=size)
+    if negative:
+        codes -= n_distinct // 2
+    if dtype == "int":
+        return pd.Series(codes)
+    if dtype == "float":
+        return pd.Series(codes * 0.5 + 0.25)
+    labels = np.array([f"value_{i}" for i in range(n_distinct)], dtype=object)
+    if dtype == "string":
+        return pd.Series(labels[codes - codes.min()])
+    return pd.Series(pd.Categorical.from_codes(codes - codes.min(), labels))
+
+
+# name: (function of the series and output, dtypes it applies to)
+FUNCTIONS = {
+    "sequential": (lambda s, output: das.sequential(s, output=output), NUMERIC),
+    "diverging": (lambda s, output: das.diverging(s, output=output), NUMERIC),
+    "qualitative": (
+        lambda s, output: das.qualitative(s, overflow="hash", output=output),
+        DTYPES,
+    ),
+    "bar": (lambda s, output: das.bar(s, output=output), NUMERIC),
+    "bar_negative": (lambda s, output: das.bar(s, output=output), NUMERIC),
+    "style_column": (
+        lambda s, output: (
+            das.scales.style_column(s, "sequential", output=output)
+            if pd.api.types.is_numeric_dtype(s)
+            else das.scales.style_column(
+                s, "qualitative", overflow="hash", output=output
+            )
+        ),
+        DTYPES,
+    ),
+}
+
+
+def measure(func, series, output, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(series, output)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(series, output)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    conditions = len(result) if output != "function" else 1
+    return best, peak, conditions, len(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--functions", nargs="+", choices=list(FUNCTIONS), default=list(FUNCTIONS)
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=float, default=[1e3, 1e4, 1e5, 1e6, 1e7]
+    )
+    parser.add_argument(
+        "--ratios", nargs="+", type=float, default=[0.001, 0.01, 0.1, 1.0]
+    )
+    parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=DTYPES)
+    parser.add_argument(
+        "--output", choices=["conditions", "function", "classes"], default="conditions"
+    )
+    parser.add_argument("--max-categories", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'function':>13} {'dtype':>11} {'rows':>12} {'ratio':>6} "
+        f"{'time (ms)':>10} {'peak (MiB)':>11} {'conditions':>10} {'JSON (KiB)':>11}"
+    )
+    for name in args.functions:
+        func, dtypes = FUNCTIONS[name]
+        for dtype in [dtype for dtype in args.dtypes if dtype in dtypes]:
+            for size in args.sizes:
+                for ratio in args.ratios:
+                    n_distinct = max(1, int(size * ratio))
+                    if (
+                        dtype not in NUMERIC or name == "qualitative"
+                    ) and n_distinct > args.max_categories:
+                        continue
+                    series = make_series(
+                        int(size), ratio, dtype, negative=name == "bar_negative"
+                    )
+                    seconds, peak, conditions, size_bytes = measure(
+                        func, series, args.output, args.repeat
+                    )
+                    print(
+                        f"{name:>13} {dtype:>11} {int(size):>12,} {ratio:>6g} "
+                        f"{seconds * 1000:>10.2f} {peak / 2**20:>11.2f} "
+                        f"{conditions:>10,} {size_bytes / 1024:>11.1f}"
+                    )
+                    results.append(
+                        {
+                            "function": name,
+                            "dtype": dtype,
+                            "rows": int(size),
+                            "ratio": ratio,
+                            "output": args.output,
+                            "seconds": seconds,
+                            "peak_bytes": peak,
+                            "conditions": conditions,
+                            "json_bytes": size_bytes,
+                        }
+                    )
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
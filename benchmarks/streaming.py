@@ -0,0 +1,66 @@
+"""
+Fit scales from a synthetic stream of chunks, and check that memory stays bounded.
+
+The chunks are generated one at a time, so the whole column never exists in
+memory. Reports the time and the peak memory allocated (tracemalloc) while
+streaming, which should depend on the chunk size and not on the row count.
+
+    python benchmarks/streaming.py --rows 1e8 --chunk-size 1e6
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import dash_aggrid_scales as das
+
+# name: (kind of scale, parameters)
+SCALES = {
+    "sequential": ("sequential", {}),
+    "sequential_quantile": ("sequential", {"binning": "quantile"}),
+    "diverging": ("diverging", {"midpoint": 0}),
+    "bar": ("bar", {}),
+    "qualitative": ("qualitative", {}),
+}
+
+
+def stream(kind, rows, chunk_size, seed=0):
+    """Chunks of normal floats (or of integer categories for qualitative)."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk_size):
+        size = min(chunk_size, rows - start)
+        if kind == "qualitative":
+            yield rng.integers(0, 10, size=size)
+        else:
+            chunk = rng.normal(size=size)
+            chunk[rng.integers(0, size, size=size // 100)] = np.nan
+            yield chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=float, default=1e8)
+    parser.add_argument("--chunk-size", type=float, default=1e6)
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=None)
+    args = parser.parse_args()
+    rows, chunk_size = int(args.rows), int(args.chunk_size)
+
+    print(
+        f"{rows:,} rows in chunks of {chunk_size:,} ({chunk_size * 8 / 2**20:.1f} MiB)"
+    )
+    print(f"{'scale':>22} {'time (s)':>9} {'peak (MiB)':>11} {'conditions':>10}")
+    for name in args.scales or SCALES:
+        kind, kwargs = SCALES[name]
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = das.from_chunks(stream(kind, rows, chunk_size), kind, **kwargs)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>22} {seconds:>9.2f} {peak / 2**20:>11.2f} {len(result):>10}")
+
+
+if __name__ == "__main__":
+    main()
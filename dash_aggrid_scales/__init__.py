@@ -1,2 +1,41 @@
 __version__ = "0.2.1"
+from . import scales
+from .cache import MemoryCache, SQLiteCache, cache_info, disable_cache, enable_cache
+from .css import clear_stylesheet, stylesheet, write_stylesheet
+from .instrumentation import add_listener, record_calls, remove_listener
+from .io import from_parquet, read_arrow, read_npy
+from .objects import (
+    BarScale,
+    DivergingScale,
+    QualitativeScale,
+    SequentialScale,
+    from_chunks,
+)
 from .scales import *
+from .simulator import simulate
+from .sketch import QuantileSketch
+
+__all__ = [
+    "BarScale",
+    "DivergingScale",
+    "MemoryCache",
+    "QualitativeScale",
+    "QuantileSketch",
+    "SQLiteCache",
+    "SequentialScale",
+    "add_listener",
+    "cache_info",
+    "clear_stylesheet",
+    "disable_cache",
+    "enable_cache",
+    "from_chunks",
+    "from_parquet",
+    "read_arrow",
+    "read_npy",
+    "record_calls",
+    "remove_listener",
+    "simulate",
+    "stylesheet",
+    "write_stylesheet",
+]
+__all__ += scales.__all__
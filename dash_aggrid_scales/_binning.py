@@ -0,0 +1,66 @@
+"""Equal-width bin edges computed from the minimum and maximum of the data."""
+
+import numpy as np
+
+
+def _round_frac(x, precision):
+    # Round the fractional part of `x`, same as `pd.cut` does for its labels
+    if not np.isfinite(x) or x == 0:
+        return x
+    frac, whole = np.modf(x)
+    if whole == 0:
+        digits = -int(np.floor(np.log10(abs(frac)))) - 1 + precision
+    else:
+        digits = precision
+    return np.around(x, digits)
+
+
+def _infer_precision(base_precision, bins):
+    for precision in range(base_precision, 20):
+        levels = [_round_frac(b, precision) for b in bins]
+        if len(set(levels)) == len(bins):
+            return precision
+    return base_precision
+
+
+def equal_width_edges(min_val, max_val, num_bins, precision=3):
+    """
+    Compute `num_bins` equal-width bin edges between `min_val` and `max_val`.
+
+    The edges are identical to the categories of
+    `pd.cut(series, num_bins, include_lowest=True)`: the range is extended by
+    0.1% on the left, and the edges are rounded to `precision` significant
+    fractional digits.
+
+    Parameters
+    ----------
+    min_val, max_val : float
+        The range of the data.
+    num_bins : int
+        The number of bins.
+    precision : int, default 3
+        The precision used to round the edges.
+
+    Returns
+    -------
+    list
+        `num_bins + 1` sorted edges. The bins are open on the left and closed
+        on the right.
+    """
+    # Booleans can't be subtracted, and pd.cut casts all the data to floats
+    min_val, max_val = float(min_val), float(max_val)
+    if np.isinf(min_val) or np.isinf(max_val):
+        raise ValueError("Cannot compute bins for data that contains infinity.")
+    if min_val == max_val:
+        min_val -= 0.001 * abs(min_val) if min_val != 0 else 0.001
+        max_val += 0.001 * abs(max_val) if max_val != 0 else 0.001
+        bins = np.linspace(min_val, max_val, num_bins + 1, endpoint=True)
+    else:
+        bins = np.linspace(min_val, max_val, num_bins + 1, endpoint=True)
+        bins[0] -= (max_val - min_val) * 0.001
+
+    precision = _infer_precision(precision, bins)
+    edges = [_round_frac(b, precision) for b in bins]
+    # The first bin includes its lower edge
+    edges[0] = edges[0] - 10 ** (-precision)
+    return edges
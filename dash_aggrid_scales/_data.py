@@ -0,0 +1,321 @@
+"""
+Read columns from pandas, NumPy, PyArrow, Polars and plain sequences.
+
+The scale functions only need a few reductions of their input (size, min/max
+and distinct values). Instead of converting everything to a pandas Series,
+`column` returns a NumPy array or a PyArrow array that shares the memory of the
+input, and the reductions run directly on it.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Number of values reduced at a time, small enough for the chunk to stay in
+# cache while both its minimum and maximum are computed.
+_CHUNK_SIZE = 1 << 16
+
+
+def _is_arrow(values):
+    return type(values).__module__.startswith("pyarrow")
+
+
+def _is_column(item):
+    return isinstance(item, (pd.Series, np.ndarray)) or type(item).__module__.partition(
+        "."
+    )[0] in ("pyarrow", "polars")
+
+
+def column(data):
+    """
+    Get the values of `data` without copying them.
+
+    Parameters
+    ----------
+    data : pd.Series, np.ndarray, pa.Array, pa.ChunkedArray, pl.Series or sequence
+        The column to read. DataFrames (pandas or Polars), PyArrow tables and
+        lists of columns are read as several columns sharing one scale.
+
+    Returns
+    -------
+    np.ndarray or pa.Array or pa.ChunkedArray or list
+        NumPy-backed pandas Series and NumPy arrays are returned as NumPy
+        arrays, and Arrow-backed pandas Series, PyArrow arrays and Polars
+        Series as PyArrow arrays, all sharing the memory of `data`. Nullable
+        pandas columns are converted to floats with NaN for missing values,
+        and other sequences with `np.asarray`. Several columns are returned as
+        a list of the values of each column, without concatenating them.
+    """
+    if isinstance(data, pd.DataFrame):
+        return [column(data.iloc[:, i]) for i in range(data.shape[1])]
+    if isinstance(data, (list, tuple)) and data and all(map(_is_column, data)):
+        return [column(item) for item in data]
+    if isinstance(data, pd.Series):
+        if isinstance(data.array, pd.arrays.ArrowExtensionArray):
+            return data.array.__arrow_array__()
+        if isinstance(data.dtype, pd.api.extensions.ExtensionDtype):
+            if pd.api.types.is_numeric_dtype(data.dtype):
+                return data.to_numpy(dtype="float64", na_value=np.nan)
+            return data.to_numpy()
+        return data.to_numpy()
+    module = type(data).__module__.partition(".")[0]
+    if module == "pyarrow":
+        # Tables and record batches have several columns
+        return list(data.columns) if hasattr(data, "columns") else data
+    if module == "polars":
+        if hasattr(data, "get_columns"):
+            return [series.to_arrow() for series in data.get_columns()]
+        return data.to_arrow()
+    return np.asarray(data)
+
+
+def size(values):
+    """The number of values in `values` (as returned by `column`)."""
+    if isinstance(values, list):
+        return sum(size(item) for item in values)
+    return np.size(values) if isinstance(values, np.ndarray) else len(values)
+
+
+def dtype(values):
+    """A description of the type of `values` (as returned by `column`)."""
+    if isinstance(values, list):
+        return ", ".join(dict.fromkeys(dtype(item) for item in values))
+    return str(values.type if _is_arrow(values) else values.dtype)
+
+
+def is_numeric(values):
+    """Whether `values` (as returned by `column`) hold numbers."""
+    if isinstance(values, list):
+        return all(is_numeric(item) for item in values)
+    if _is_arrow(values):
+        import pyarrow as pa
+
+        return (
+            pa.types.is_integer(values.type)
+            or pa.types.is_floating(values.type)
+            or pa.types.is_decimal(values.type)
+            or pa.types.is_boolean(values.type)
+        )
+    return pd.api.types.is_numeric_dtype(values.dtype)
+
+
+def count_missing(values):
+    """Count the NaNs and nulls of `values` (as returned by `column`)."""
+    if isinstance(values, list):
+        return sum(count_missing(item) for item in values)
+    if _is_arrow(values):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        missing = values.null_count
+        if pa.types.is_floating(values.type):
+            missing += pc.sum(pc.is_nan(values)).as_py() or 0
+        return missing
+    if values.dtype.kind not in "fcOmM":
+        return 0
+    # In memory order: no copy of arrays in Fortran order or memory-mapped
+    values = np.ravel(values, order="K")
+    return sum(
+        int(np.count_nonzero(pd.isna(values[start : start + _CHUNK_SIZE])))
+        for start in range(0, values.size, _CHUNK_SIZE)
+    )
+
+
+def min_max(values):
+    """
+    Compute the minimum and maximum of `values`, ignoring NaNs and nulls.
+
+    NumPy arrays are reduced in cache-sized chunks, so the data is read from
+    memory once and nothing the size of the input is allocated. Arrow arrays
+    are reduced with `pyarrow.compute.min_max`.
+
+    Parameters
+    ----------
+    values : np.ndarray or pa.Array or pa.ChunkedArray
+        Numeric data, as returned by `column`.
+
+    Returns
+    -------
+    tuple
+        The minimum and maximum, NaN if all values are missing. Several
+        columns are reduced one after the other, for a shared range.
+    """
+    if size(values) == 0:
+        raise ValueError("Cannot compute bins for an empty series.")
+    if isinstance(values, list):
+        extremes = [min_max(item) for item in values if size(item)]
+        return (
+            np.fmin.reduce([low for low, _ in extremes]),
+            np.fmax.reduce([high for _, high in extremes]),
+        )
+    if _is_arrow(values):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        result = pc.min_max(values)
+        min_val, max_val = result["min"].as_py(), result["max"].as_py()
+        if pa.types.is_decimal(values.type) and min_val is not None:
+            # Decimals don't support the NumPy functions the scales use
+            min_val, max_val = float(min_val), float(max_val)
+        return (
+            np.nan if min_val is None else min_val,
+            np.nan if max_val is None else max_val,
+        )
+    values = np.ravel(values, order="K")
+    mins = []
+    maxs = []
+    for start in range(0, values.size, _CHUNK_SIZE):
+        chunk = values[start : start + _CHUNK_SIZE]
+        mins.append(np.fmin.reduce(chunk))
+        maxs.append(np.fmax.reduce(chunk))
+    if values.dtype.kind == "b":
+        # Booleans can't be subtracted, and pd.cut casts them to floats
+        return float(min(mins)), float(max(maxs))
+    return np.fmin.reduce(mins), np.fmax.reduce(maxs)
+
+
+def chunks(values, size=_CHUNK_SIZE):
+    """
+    Iterate over numeric `values` in chunks of `size`, as float NumPy arrays.
+
+    Missing values are NaN. Only one chunk at a time is copied, if the values
+    are not already floats in a NumPy array.
+    """
+    if isinstance(values, list):
+        for item in values:
+            yield from chunks(item, size)
+        return
+    if _is_arrow(values):
+        for start in range(0, len(values), size):
+            chunk = values.slice(start, size).to_numpy(zero_copy_only=False)
+            yield chunk.astype("float64", copy=False)
+        return
+    values = np.ravel(values, order="K")
+    for start in range(0, values.size, size):
+        yield values[start : start + size].astype("float64", copy=False)
+
+
+def bin_counts(values, edges):
+    """
+    Count the numeric `values` in each bin between sorted `edges`.
+
+    Bins are open on the left and closed on the right, like the conditions of
+    the scales. Values outside of the edges, NaNs and nulls are not counted.
+
+    Returns
+    -------
+    np.ndarray
+        The number of values in each of the `len(edges) - 1` bins.
+    """
+    edges = np.asarray(edges, dtype="float64")
+    counts = np.zeros(len(edges) + 1, dtype=np.int64)
+    for chunk in chunks(values):
+        counts += np.bincount(
+            np.searchsorted(edges, chunk, side="left"), minlength=len(edges) + 1
+        )
+    # Values <= the first edge are in the first count, above the last edge
+    # (and NaNs) in the last one
+    return counts[1:-1]
+
+
+def _distinct(values):
+    # Distinct values without NaNs and nulls, in memory order
+    if _is_arrow(values):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        distinct = pc.unique(values).drop_null()
+        if pa.types.is_decimal(distinct.type):
+            # As floats, like the minimum and maximum
+            distinct = distinct.cast(pa.float64())
+        if pa.types.is_floating(distinct.type):
+            distinct = distinct.filter(pc.invert(pc.is_nan(distinct)))
+        return distinct
+    distinct = pd.unique(np.ravel(values, order="K"))
+    return distinct[~pd.isna(distinct)]
+
+
+def _union(values, limit=None):
+    # The distinct values of several columns, stopping after `limit` of them
+    seen = set()
+    for item in values:
+        if not _is_arrow(item):
+            # Chunks of values rather than of rows, in memory order
+            item = np.ravel(item, order="K")
+        for start in range(0, len(item), _CHUNK_SIZE):
+            distinct = _distinct(item[start : start + _CHUNK_SIZE])
+            seen.update(
+                distinct.to_pylist() if _is_arrow(distinct) else distinct.tolist()
+            )
+            if limit is not None and len(seen) > limit:
+                return seen
+    return seen
+
+
+def nunique(values, limit=None):
+    """
+    Count the distinct values of `values`, without NaNs and nulls.
+
+    With a `limit`, the data is scanned in chunks and counting stops as soon
+    as more than `limit` distinct values are found, so memory use is bounded
+    by the limit instead of by the cardinality of the data.
+    """
+    if isinstance(values, list):
+        return len(_union(values, limit))
+    if limit is None:
+        return len(_distinct(values))
+    if not _is_arrow(values):
+        # Chunks of values rather than of rows, in memory order
+        values = np.ravel(values, order="K")
+    seen = set()
+    for start in range(0, len(values), _CHUNK_SIZE):
+        chunk = values[start : start + _CHUNK_SIZE]
+        distinct = _distinct(chunk)
+        seen.update(distinct.to_pylist() if _is_arrow(chunk) else distinct.tolist())
+        if len(seen) > limit:
+            break
+    return len(seen)
+
+
+def unique(values):
+    """
+    Get the sorted distinct values of `values`, without NaNs and nulls.
+
+    Parameters
+    ----------
+    values : np.ndarray or pa.Array or pa.ChunkedArray
+        The data, as returned by `column`.
+
+    Returns
+    -------
+    list
+        The distinct values as Python objects. If they can't be compared,
+        they are returned in order of appearance.
+    """
+    if isinstance(values, list):
+        distinct = list(_union(values))
+        try:
+            return sorted(distinct)
+        except TypeError:
+            return distinct
+    distinct = _distinct(values)
+    if _is_arrow(values):
+        import pyarrow.compute as pc
+
+        return distinct.take(pc.sort_indices(distinct)).to_pylist()
+    distinct = distinct.tolist()
+    try:
+        return sorted(distinct)
+    except TypeError:
+        return distinct
+
+
+def categories(data):
+    """
+    Get the categories of `data`, for qualitative scales.
+
+    The categories of a categorical pandas Series are used as they are, in
+    their defined order. Otherwise these are the sorted distinct values.
+    """
+    if isinstance(data, pd.Series) and isinstance(data.dtype, pd.CategoricalDtype):
+        return data.cat.categories.tolist()
+    return unique(column(data))
@@ -0,0 +1,125 @@
+"""
+Run `style_frame` over groups of columns in a pool of workers.
+
+With a process pool, NumPy-backed numeric columns are copied once into shared
+memory, and the workers read them from there instead of receiving a pickled
+copy. Other columns (strings, categoricals, nullable types) are pickled.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from . import css
+from .scales import style_frame
+
+
+def _gil_enabled():
+    # Free-threaded builds (3.13t and later) can run the columns on threads
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        # The parent process owns the block and unlinks it
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _style_task(columns, spec):
+    # Worker: rebuild the task's columns, from shared memory where possible.
+    # The styles of the classes used by the column definitions are returned
+    # with them, since they are registered in the worker's stylesheet.
+    blocks = []
+    data = {}
+    try:
+        for field, (kind, payload) in columns.items():
+            if kind == "shared":
+                name, dtype, length = payload
+                blocks.append(_attach(name))
+                data[field] = np.ndarray(length, dtype=dtype, buffer=blocks[-1].buf)
+            else:
+                data[field] = payload
+        columnDefs = style_frame(pd.DataFrame(data, copy=False), spec)
+        styles = {
+            name: css._registry[name]
+            for columnDef in columnDefs
+            for name in columnDef.get("cellClassRules", {})
+        }
+        return columnDefs, styles
+    finally:
+        # The arrays must be released before their shared memory is closed
+        data.clear()
+        for block in blocks:
+            block.close()
+
+
+def _share(series, blocks):
+    # Copy a NumPy-backed numeric column to shared memory, or pickle it as is
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        values = series.to_numpy()
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        blocks.append(block)
+        np.ndarray(len(values), dtype=values.dtype, buffer=block.buf)[:] = values
+        return "shared", (block.name, values.dtype.str, len(values))
+    return "pickled", series
+
+
+def style_frame_parallel(df, spec, max_workers, executor="auto", chunksize=None):
+    """
+    Style the columns of `spec` concurrently, see `style_frame`.
+
+    Columns are grouped in tasks of `chunksize` distinct fields, so all the
+    definitions of a column are computed in the same task and share their
+    statistics.
+    """
+    if executor == "auto":
+        executor = "process" if _gil_enabled() else "thread"
+    if executor not in ("process", "thread"):
+        raise ValueError(
+            f"executor must be 'auto', 'process' or 'thread', got '{executor}'."
+        )
+
+    spec = [{"field": item} if isinstance(item, str) else item for item in spec]
+    fields = list(dict.fromkeys(item["field"] for item in spec if item.get("scale")))
+    if chunksize is None:
+        chunksize = max(1, len(fields) // (max_workers * 4))
+    groups = [fields[i : i + chunksize] for i in range(0, len(fields), chunksize)]
+
+    results = {}
+    blocks = []
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    try:
+        with pool_class(max_workers=max_workers) as pool:
+            tasks = []
+            for group in groups:
+                group_spec = [item for item in spec if item["field"] in group]
+                if executor == "process":
+                    columns = {field: _share(df[field], blocks) for field in group}
+                    future = pool.submit(_style_task, columns, group_spec)
+                else:
+                    future = pool.submit(style_frame, df[group], group_spec)
+                tasks.append((group_spec, future))
+            for group_spec, future in tasks:
+                if executor == "process":
+                    columnDefs, styles = future.result()
+                    css._register(styles)
+                else:
+                    columnDefs = future.result()
+                for item, columnDef in zip(group_spec, columnDefs):
+                    results[id(item)] = columnDef
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    columnDefs = []
+    for item in spec:
+        if id(item) in results:
+            columnDefs.append(results[id(item)])
+        else:
+            columnDefs.append(style_frame(df, [item])[0])
+    return columnDefs
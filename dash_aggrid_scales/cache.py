@@ -0,0 +1,339 @@
+"""
+Opt-in memoization of the scale functions, keyed by the content of the data.
+
+Dash callbacks often regenerate the conditions of columns that did not change.
+With the cache enabled, `sequential`, `diverging`, `qualitative` and `bar`
+hash the buffer of their input column together with their parameters, and
+return the stored conditions when the same column is styled the same way.
+
+    >>> import dash_aggrid_scales as das
+    >>> das.enable_cache(maxsize=512)
+    >>> das.cache_info()
+
+The default backend keeps the outputs in the memory of the process. To share
+them between processes, for example gunicorn workers, store them in SQLite:
+
+    >>> das.enable_cache(backend=das.SQLiteCache("/tmp/scales.sqlite", ttl=3600))
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from . import __version__, _data
+from .css import class_rules
+
+
+class MemoryCache:
+    """
+    An in-memory LRU cache of generated conditions.
+
+    Parameters
+    ----------
+    maxsize : int, default 256
+        The maximum number of entries.
+    max_bytes : int, optional
+        The maximum total size of the entries, measured as the length of
+        their JSON serialization.
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int | None = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the value stored under `key`, or None."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def set(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entries."""
+        size = len(json.dumps(value))
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None
+                and self._bytes > self.max_bytes
+                and len(self._entries) > 1
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        """Remove all the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Hit/miss statistics and the size of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+
+class SQLiteCache:
+    """
+    A cache of generated conditions stored in a SQLite database.
+
+    Several processes can use the same file: each entry is written in a
+    single transaction, so readers see either the whole entry or nothing, and
+    an output computed by one process is reused by the others.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The database file, created if needed.
+    ttl : float, optional
+        The number of seconds after which entries expire. Expired entries are
+        ignored, and deleted when new entries are written.
+    timeout : float, default 30
+        The number of seconds to wait for another process's write to finish.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: float | None = None,
+        timeout: float = 30,
+    ):
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS conditions "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def _connection(self):
+        # One connection per thread, and a new one in forked processes
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _expiry(self):
+        return -math.inf if self.ttl is None else time.time() - self.ttl
+
+    def get(self, key):
+        """Return the value stored under `key`, or None if missing or expired."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM conditions WHERE key = ? AND created >= ?",
+                (key, self._expiry()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        """Store `value` under `key`, and delete the expired entries."""
+        with self._connection() as connection:
+            if self.ttl is not None:
+                connection.execute(
+                    "DELETE FROM conditions WHERE created < ?", (self._expiry(),)
+                )
+            connection.execute(
+                "INSERT OR REPLACE INTO conditions VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+
+    def clear(self):
+        """Remove all the entries and reset the statistics."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM conditions")
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Hit/miss statistics of this process, and the size of the database."""
+        entries, size = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM conditions "
+                "WHERE created >= ?",
+                (self._expiry(),),
+            )
+            .fetchone()
+        )
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+_cache = None
+
+
+def enable_cache(
+    maxsize: int = 256,
+    max_bytes: int | None = 64 * 2**20,
+    backend=None,
+):
+    """
+    Memoize the outputs of `sequential`, `diverging`, `qualitative` and `bar`.
+
+    The returned conditions are shared between calls with the same data and
+    parameters, and should not be modified in place.
+
+    Parameters
+    ----------
+    maxsize : int, default 256
+        The maximum number of cached outputs.
+    max_bytes : int, optional (default: 64 MiB)
+        The maximum total size of the cached outputs, as serialized to JSON.
+    backend : object, optional
+        Where to store the outputs, instead of a `MemoryCache` of `maxsize`
+        and `max_bytes`. Any object with `get(key)`, `set(key, value)`,
+        `clear()` and `info()` methods can be used, like `SQLiteCache`.
+    """
+    global _cache
+    _cache = MemoryCache(maxsize, max_bytes) if backend is None else backend
+
+
+def disable_cache():
+    """Stop memoizing the scale functions, and drop the cached outputs."""
+    global _cache
+    _cache = None
+
+
+def cache_info():
+    """
+    Report the statistics of the cache.
+
+    Returns
+    -------
+    dict or None
+        The hits, misses, hit rate, number of entries and total size in bytes
+        of the cache, or None if it is not enabled.
+    """
+    return None if _cache is None else _cache.info()
+
+
+def fingerprint(data):
+    """
+    Hash the content of a column, reading its buffers without copying them.
+
+    Parameters
+    ----------
+    data : pd.Series or array-like
+        Any input accepted by the scale functions.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever the values (or their type) change.
+    """
+    # SHA-256 is hardware-accelerated on most CPUs, faster than BLAKE2 there
+    digest = hashlib.sha256()
+    if isinstance(data, pd.Series) and isinstance(data.dtype, pd.CategoricalDtype):
+        # The categories, and their order, are part of the output
+        digest.update(repr(data.cat.categories.tolist()).encode())
+    values = _data.column(data)
+    if isinstance(values, list):
+        # Several columns sharing a scale
+        for item in values:
+            digest.update(fingerprint(item).encode())
+        return digest.hexdigest()
+    if _data._is_arrow(values):
+        digest.update(str(values.type).encode())
+        for chunk in getattr(values, "chunks", [values]):
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+        return digest.hexdigest()
+    # In memory order, the outputs do not depend on the order of the values
+    values = np.ravel(values, order="K")
+    if values.dtype == object:
+        # Hash the objects' values, not their addresses. The values are hashed
+        # as strings, so their types are hashed too: '1' and 1 differ.
+        types = np.array(
+            [
+                f"{type(value).__module__}.{type(value).__qualname__}"
+                for value in values
+            ],
+            dtype=object,
+        )
+        digest.update(pd.util.hash_array(types))
+        values = pd.util.hash_array(values)
+    digest.update(values.dtype.str.encode())
+    digest.update(np.ascontiguousarray(values))
+    return digest.hexdigest()
+
+
+def memoize(func):
+    """Cache the outputs of a scale function, when the cache is enabled."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if bound.arguments.get("output") == "classes":
+            # Cache the conditions, so that the styles of the classes are
+            # registered for the stylesheet on hits too
+            bound.arguments["output"] = "conditions"
+            return class_rules(wrapper(*bound.args, **bound.kwargs))
+        series = bound.arguments.pop("series")
+        # Outputs can change between versions, and persistent backends outlive them
+        key = hashlib.sha256(
+            f"{func.__name__}:{__version__}:{fingerprint(series)}:"
+            f"{bound.arguments!r}".encode()
+        ).hexdigest()
+        result = cache.get(key)
+        if result is None:
+            result = func(*args, **kwargs)
+            cache.set(key, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,131 @@
+"""
+CSS classes for the styles of the scales, instead of inline styles.
+
+With `output="classes"`, the scale functions return `cellClassRules` that
+point at class names derived from each style, and register the styles here.
+The same style always gets the same class, so columns and grids that use the
+same scale share their rules, and `stylesheet` writes each one only once.
+
+    >>> columnDefs = [
+    ...     {"field": "pop", "cellClassRules": das.sequential(df["pop"], output="classes")},
+    ... ]
+    >>> das.write_stylesheet("assets/scales.css")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+# Class names and the styles they stand for, in order of registration
+_registry = {}
+_lock = threading.Lock()
+
+
+def class_name(style):
+    """
+    Get the CSS class of a style, and register it.
+
+    Parameters
+    ----------
+    style : dict
+        CSS properties, as in the 'style' of a style condition.
+
+    Returns
+    -------
+    str
+        A class name derived from the properties, stable across processes.
+    """
+    key = json.dumps(style, sort_keys=True)
+    name = "das-" + hashlib.sha256(key.encode()).hexdigest()[:10]
+    with _lock:
+        _registry.setdefault(name, style)
+    return name
+
+
+def _register(styles):
+    # Register classes used in another process, for example a worker of
+    # `style_frame`
+    with _lock:
+        for name, style in styles.items():
+            _registry.setdefault(name, style)
+
+
+def class_rules(styleConditions):
+    """
+    Convert style conditions to `cellClassRules`.
+
+    Conditions with the same style are combined in one rule, since the
+    conditions of a scale never match the same value.
+
+    Parameters
+    ----------
+    styleConditions : list of dict
+        Style conditions, as returned by the scale functions.
+
+    Returns
+    -------
+    dict
+        Class names mapped to the JS conditions of their cells.
+    """
+    rules = {}
+    for item in styleConditions:
+        rules.setdefault(class_name(item["style"]), []).append(item["condition"])
+    return {
+        name: conditions[0]
+        if len(conditions) == 1
+        else " || ".join(f"({condition})" for condition in conditions)
+        for name, conditions in rules.items()
+    }
+
+
+def _property(key):
+    # backgroundColor -> background-color
+    return re.sub(r"(?<!^)([A-Z])", r"-\1", key).lower()
+
+
+def stylesheet():
+    """
+    Generate the CSS of all the classes used so far.
+
+    Returns
+    -------
+    str
+        One rule per class. The selectors include `.ag-cell` so that they
+        take precedence over the styles of the grid's theme.
+    """
+    with _lock:
+        styles = list(_registry.items())
+    return "".join(
+        f".ag-cell.{name} {{"
+        + " ".join(f"{_property(key)}: {value};" for key, value in style.items())
+        + "}\n"
+        for name, style in styles
+    )
+
+
+def write_stylesheet(path: str | os.PathLike):
+    """
+    Write the CSS of all the classes used so far to a file.
+
+    The file is replaced atomically, so a server never reads it half-written.
+    Write it to the `assets` folder of a Dash app to have it served with the
+    app's other stylesheets.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The CSS file to write.
+    """
+    path = os.fspath(path)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as file:
+        file.write(stylesheet())
+    os.replace(temporary, path)
+
+
+def clear_stylesheet():
+    """Forget the classes used so far."""
+    with _lock:
+        _registry.clear()
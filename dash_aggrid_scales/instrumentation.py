@@ -0,0 +1,165 @@
+"""
+Report the cost of each call to the scale functions.
+
+For every call to `sequential`, `diverging`, `qualitative` and `bar`, a record
+is made of the function, the length and dtype of the data, the time taken,
+the number of conditions generated and the size of their JSON serialization.
+Records are only made when something consumes them:
+
+- `record_calls`, a context manager that collects the records of the calls
+  made in its block, for example in a Dash callback (each callback, thread or
+  asyncio task has its own recorder).
+- Listeners, functions registered with `add_listener` that receive every
+  record.
+- The "dash_aggrid_scales" logger, when it is enabled for DEBUG messages.
+
+    >>> with das.record_calls() as recorder:
+    ...     columnDefs = make_column_defs(df)
+    >>> recorder.totals()
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import time
+
+import pandas as pd
+
+from . import _data
+
+logger = logging.getLogger("dash_aggrid_scales")
+
+_listeners = []
+_recorder = contextvars.ContextVar("dash_aggrid_scales_recorder", default=None)
+
+
+class Recorder:
+    """The records of the calls made in a `record_calls` block."""
+
+    def __init__(self):
+        self.calls = []
+
+    def totals(self):
+        """
+        Aggregate the records per function.
+
+        Returns
+        -------
+        dict
+            For each function, and for all of them under 'total', the number
+            of calls, and the total time, conditions and bytes.
+        """
+        totals = {}
+        for call in self.calls:
+            for name in (call["function"], "total"):
+                total = totals.setdefault(
+                    name, {"calls": 0, "seconds": 0.0, "conditions": 0, "bytes": 0}
+                )
+                total["calls"] += 1
+                total["seconds"] += call["seconds"]
+                total["conditions"] += call["conditions"]
+                total["bytes"] += call["bytes"]
+        return totals
+
+
+@contextlib.contextmanager
+def record_calls():
+    """
+    Collect the records of the calls to the scale functions made in a block.
+
+    Blocks can be nested, the calls are recorded by the innermost one.
+
+    Yields
+    ------
+    Recorder
+        The records are in its `calls` attribute, and `totals()` sums them.
+    """
+    recorder = Recorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def add_listener(listener):
+    """
+    Call `listener` with the record of every call to the scale functions.
+
+    Parameters
+    ----------
+    listener : callable
+        A function of one argument, the record: a dict with 'function',
+        'length', 'dtype', 'seconds', 'conditions' and 'bytes'.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Stop calling a listener registered with `add_listener`."""
+    _listeners.remove(listener)
+
+
+def _describe(series):
+    # The number of values and the dtype of the input. pandas objects are
+    # described as they are: `_data.column` would convert nullable and
+    # categorical columns again, and report the dtype of the conversion.
+    if isinstance(series, pd.Series):
+        return len(series), str(series.dtype)
+    if isinstance(series, pd.DataFrame):
+        return series.size, ", ".join(dict.fromkeys(map(str, series.dtypes)))
+    if (
+        isinstance(series, (list, tuple))
+        and series
+        and all(map(_data._is_column, series))
+    ):
+        described = [_describe(item) for item in series]
+        return (
+            sum(length for length, _ in described),
+            ", ".join(dict.fromkeys(dtype for _, dtype in described)),
+        )
+    values = _data.column(series)
+    return _data.size(values), _data.dtype(values)
+
+
+def instrument(func):
+    """Record the calls to a scale function, when the records are consumed."""
+
+    @functools.wraps(func)
+    def wrapper(series, *args, **kwargs):
+        recorder = _recorder.get()
+        if (
+            recorder is None
+            and not _listeners
+            and not logger.isEnabledFor(logging.DEBUG)
+        ):
+            return func(series, *args, **kwargs)
+        start = time.perf_counter()
+        result = func(series, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        length, dtype = _describe(series)
+        record = {
+            "function": func.__name__,
+            "length": length,
+            "dtype": dtype,
+            "seconds": seconds,
+            "conditions": 1
+            if isinstance(result, dict) and "function" in result
+            else len(result),
+            "bytes": len(json.dumps(result)),
+        }
+        if recorder is not None:
+            recorder.calls.append(record)
+        # A copy, since listeners may remove themselves when called
+        for listener in _listeners.copy():
+            listener(record)
+        logger.debug(
+            "%(function)s: %(length)d %(dtype)s values, %(conditions)d conditions, "
+            "%(bytes)d bytes in %(seconds).6fs",
+            record,
+        )
+        return result
+
+    return wrapper
@@ -0,0 +1,199 @@
+"""
+Build scales from data files, reading as little of them as possible.
+
+Parquet files store the minimum and maximum of each column, per row group,
+in their footer. `from_parquet` builds `sequential`, `diverging` and `bar`
+scales from these statistics alone, without reading the data, and falls back
+to reading the column in batches when they are missing.
+
+`.npy` and Arrow IPC files are memory-mapped by `read_npy` and `read_arrow`:
+the scale functions then read the data straight from the OS page cache,
+which is shared by all the processes (for example gunicorn workers) that map
+the same file, instead of from a copy in the memory of each process.
+"""
+
+import mmap
+import os
+from decimal import Decimal
+
+import numpy as np
+
+from .objects import _KINDS
+
+_BATCH_SIZE = 1 << 20
+
+
+def _row_group_stats(metadata, column):
+    # The number of values, nulls, minimum and maximum of a column from the
+    # statistics of its row groups, or None if some are missing
+    count = missing = 0
+    low = high = None
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        chunks = [row_group.column(j) for j in range(row_group.num_columns)]
+        chunk = next((c for c in chunks if c.path_in_schema == column), None)
+        if chunk is None:
+            raise ValueError(f"Column '{column}' is not in the file.")
+        if row_group.num_rows == 0:
+            continue
+        stats = chunk.statistics
+        if stats is None or not stats.has_null_count:
+            return None
+        if not stats.has_min_max:
+            if stats.null_count == row_group.num_rows:
+                # Only nulls
+                count += row_group.num_rows
+                missing += stats.null_count
+                continue
+            return None
+        if not isinstance(stats.min, (int, float, Decimal)):
+            return None
+        low = stats.min if low is None else min(low, stats.min)
+        high = stats.max if high is None else max(high, stats.max)
+        count += row_group.num_rows
+        missing += stats.null_count
+    to_float = float if isinstance(low, Decimal) else lambda value: value
+    return (
+        count,
+        missing,
+        float("nan") if low is None else to_float(low),
+        float("nan") if high is None else to_float(high),
+    )
+
+
+def from_parquet(
+    path: str | os.PathLike,
+    column: str,
+    kind: str = "sequential",
+    output: str = "conditions",
+    batch_size: int = _BATCH_SIZE,
+    **kwargs,
+):
+    """
+    Generate the conditions of a scale for a column of a Parquet file.
+
+    `sequential` (with equal-width bins), `diverging` and `bar` scales only
+    depend on the minimum and maximum of the data, which are read from the
+    statistics of the file's row groups, in the footer: the time taken depends
+    on the number of row groups, not on the number of rows. For `bar`, the
+    range is then always split into `max_conditions` buckets, since the
+    distinct values of the column are not known.
+
+    Other scales, and files without statistics for the column, are built from
+    the data, read in batches of `batch_size` rows.
+
+    Parameters
+    ----------
+    path : str or os.PathLike or file-like
+        The Parquet file.
+    column : str
+        The name of the column.
+    kind : {'sequential', 'diverging', 'qualitative', 'bar'}, default 'sequential'
+        The kind of scale.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        The kind of output, see the scale functions.
+    batch_size : int, optional
+        The number of rows read at a time, when the data has to be read.
+    **kwargs
+        The parameters of the scale, see `SequentialScale`, `DivergingScale`,
+        `QualitativeScale` and `BarScale`.
+
+    Returns
+    -------
+    list of dict or dict
+        The conditions, as returned by the scale functions.
+    """
+    import pyarrow.parquet as pq
+
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown scale '{kind}'.")
+    scale = _KINDS[kind](**kwargs)
+    parquet_file = pq.ParquetFile(path)
+    stats = None
+    if (
+        kind in ("sequential", "diverging")
+        and scale.params.get("binning", "equal") == "equal"
+    ) or (kind == "bar" and scale.params["max_conditions"] is not None):
+        stats = _row_group_stats(parquet_file.metadata, column)
+    if stats is None:
+        batches = parquet_file.iter_batches(batch_size=batch_size, columns=[column])
+        scale.fit_chunks(batches, column=column)
+    else:
+        scale.count, scale.missing, scale.min, scale.max = stats
+        if kind == "bar":
+            # Bucket the range instead of one condition per distinct value
+            scale.distinct = None
+    return scale.to_style_conditions(output)
+
+
+def _advise(mapped):
+    # The scales read the data from start to end: read ahead, and let the
+    # kernel drop the pages behind
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+
+def _map(path):
+    # Map a whole file read-only, shared with the other processes mapping it
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    _advise(mapped)
+    return mapped
+
+
+def read_npy(path: str | os.PathLike):
+    """
+    Memory-map a `.npy` file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file, as written by `np.save`.
+
+    Returns
+    -------
+    np.memmap
+        A read-only array backed by the file. Nothing is read until the
+        array is used, and the scale functions read it in chunks.
+
+    Examples
+    --------
+    >>> das.sequential(das.read_npy("population.npy"))
+    """
+    array = np.load(path, mmap_mode="r")
+    if getattr(array, "_mmap", None) is not None:
+        _advise(array._mmap)
+    return array
+
+
+def read_arrow(path: str | os.PathLike, columns=None):
+    """
+    Memory-map an Arrow IPC file (Feather v2), in the file or stream format.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file, as written by `pyarrow.ipc` or `pyarrow.feather`, without
+        compression.
+    columns : list of str, optional
+        The columns to read. By default all of them.
+
+    Returns
+    -------
+    pa.Table
+        A table whose buffers point into the file. Select a column to style
+        it, or style several columns with one scale by passing the table.
+
+    Examples
+    --------
+    >>> table = das.read_arrow("stocks.arrow")
+    >>> das.diverging(table["GOOG"])
+    """
+    import pyarrow as pa
+
+    buffer = pa.py_buffer(_map(path))
+    try:
+        table = pa.ipc.open_file(buffer).read_all()
+    except pa.ArrowInvalid:
+        table = pa.ipc.open_stream(buffer).read_all()
+    return table if columns is None else table.select(columns)
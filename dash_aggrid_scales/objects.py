@@ -0,0 +1,493 @@
+"""
+Scales that are fitted once, and turned into style conditions any number of times.
+
+The scale functions compute the statistics of their input on every call. The
+classes of this module keep these statistics instead: fit them once (at
+startup, or in a deploy step), possibly over chunks of data with
+`partial_fit`, then generate the conditions of each request from the fitted
+scale, without touching the data. Fitted scales can be pickled, or saved as
+JSON with `to_dict` and loaded with `from_dict`.
+
+    >>> scale = das.SequentialScale(colorscale="viridis").fit(df["pop"])
+    >>> json.dump(scale.to_dict(), file)
+    >>> scale = das.SequentialScale.from_dict(json.load(file))
+    >>> {"field": "pop", "cellStyle": {"styleConditions": scale.to_style_conditions()}}
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from . import _data
+from .scales import (
+    _binned_styles,
+    _check_output,
+    _diverging_bins,
+    _diverging_range,
+    _empty_bar,
+    _extend_edges,
+    _qualitative,
+    _resolve_colorscale,
+    bar_from_stats,
+    sequential_from_stats,
+)
+from .sketch import QuantileSketch
+
+# Scale classes by kind, for `from_dict`
+_KINDS = {}
+
+
+def _python(value):
+    # NumPy scalars as Python objects, for JSON
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class _Scale:
+    """Shared logic of the fitted scales."""
+
+    kind = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _KINDS[cls.kind] = cls
+
+    def __init__(self, **params):
+        self.params = params
+        self.reset()
+
+    def __repr__(self):
+        params = ", ".join(f"{key}={value!r}" for key, value in self.params.items())
+        return f"{type(self).__name__}({params})"
+
+    def reset(self):
+        """Forget the data seen so far."""
+        self.count = 0
+        self.missing = 0
+        self.min = math.nan
+        self.max = math.nan
+
+    def fit(self, data):
+        """
+        Compute the statistics of the scale from `data`.
+
+        Parameters
+        ----------
+        data : pd.Series or array-like
+            Any input accepted by the scale functions.
+
+        Returns
+        -------
+        The scale itself.
+        """
+        self.reset()
+        return self.partial_fit(data)
+
+    def partial_fit(self, data):
+        """
+        Update the statistics of the scale with a chunk of data.
+
+        Parameters
+        ----------
+        data : pd.Series or array-like
+            Any input accepted by the scale functions.
+
+        Returns
+        -------
+        The scale itself.
+        """
+        values = _data.column(data)
+        self._update(values)
+        self.count += _data.size(values)
+        self.missing += _data.count_missing(values)
+        return self
+
+    def fit_chunks(self, chunks, column=None):
+        """
+        Compute the statistics of the scale from an iterable of chunks of data.
+
+        Only one chunk at a time is held in memory, so the data can be much
+        larger than the memory, for example when reading a file in chunks.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The chunks, each any input accepted by the scale functions.
+        column : str, optional
+            Read this column of each chunk, for chunks of several columns
+            (like the DataFrames of `pd.read_csv(..., chunksize=...)` or the
+            record batches of a Parquet file).
+
+        Returns
+        -------
+        The scale itself.
+        """
+        self.reset()
+        for chunk in chunks:
+            self.partial_fit(chunk if column is None else chunk[column])
+        return self
+
+    def _update(self, values):
+        if _data.size(values):
+            low, high = _data.min_max(values)
+            self.min = _python(np.fmin(self.min, low))
+            self.max = _python(np.fmax(self.max, high))
+
+    def _check_fitted(self):
+        if self.count == 0:
+            raise ValueError("Cannot compute bins for an empty series.")
+
+    def _state(self):
+        return {
+            "count": self.count,
+            "missing": self.missing,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def _set_state(self, state):
+        self.count = state["count"]
+        self.missing = state["missing"]
+        self.min = state["min"]
+        self.max = state["max"]
+
+    def to_dict(self):
+        """
+        Get the parameters and the fitted statistics of the scale.
+
+        Returns
+        -------
+        dict
+            A JSON-serializable dict, that `from_dict` turns back into a scale.
+        """
+        return {"kind": self.kind, "params": self.params, "state": self._state()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a scale from the output of `to_dict`.
+
+        Parameters
+        ----------
+        data : dict
+            A scale as returned by `to_dict`. Its 'kind' selects the class.
+
+        Returns
+        -------
+        SequentialScale, DivergingScale, QualitativeScale or BarScale
+        """
+        scale = _KINDS[data["kind"]](**data["params"])
+        scale._set_state(data["state"])
+        return scale
+
+
+class SequentialScale(_Scale):
+    """
+    A fitted `sequential` scale.
+
+    Parameters
+    ----------
+    colorscale, n_colors, binning, sketch_k
+        See `sequential`. With `binning="quantile"`, the quantiles are
+        estimated with a `QuantileSketch` updated by each `partial_fit`.
+    """
+
+    kind = "sequential"
+
+    def __init__(
+        self,
+        colorscale: str = "cividis",
+        n_colors: int | None = None,
+        binning: str = "equal",
+        sketch_k: int = 200,
+    ):
+        if binning not in ("equal", "quantile"):
+            raise ValueError(f"binning must be 'equal' or 'quantile', got '{binning}'.")
+        super().__init__(
+            colorscale=colorscale, n_colors=n_colors, binning=binning, sketch_k=sketch_k
+        )
+
+    def reset(self):
+        super().reset()
+        self.sketch = None
+        if self.params["binning"] == "quantile":
+            self.sketch = QuantileSketch(self.params["sketch_k"], seed=0)
+
+    def _update(self, values):
+        super()._update(values)
+        if self.sketch is not None:
+            self.sketch.update(values)
+
+    def _state(self):
+        state = super()._state()
+        if self.sketch is not None:
+            state["sketch"] = self.sketch.to_dict()
+        return state
+
+    def _set_state(self, state):
+        super()._set_state(state)
+        if "sketch" in state:
+            self.sketch = QuantileSketch.from_dict(state["sketch"], seed=0)
+
+    def to_style_conditions(self, output: str = "conditions"):
+        """
+        Generate the conditions of the scale, see `sequential`.
+
+        Parameters
+        ----------
+        output : {'conditions', 'function', 'classes'}, default 'conditions'
+            The kind of output, see `sequential`.
+        """
+        self._check_fitted()
+        quantiles = None
+        if self.sketch is not None:
+            colorscale, n_colors = self.params["colorscale"], self.params["n_colors"]
+            num_bins = len(_resolve_colorscale(colorscale, n_colors))
+            quantiles = self.sketch.quantiles(np.linspace(0, 1, num_bins + 1))
+        return sequential_from_stats(
+            self.min,
+            self.max,
+            self.params["colorscale"],
+            n_colors=self.params["n_colors"],
+            quantiles=quantiles,
+            output=output,
+        )
+
+
+class DivergingScale(_Scale):
+    """
+    A fitted `diverging` scale.
+
+    Parameters
+    ----------
+    colorscale, midpoint, n_colors, vmin, vmax
+        See `diverging`.
+    """
+
+    kind = "diverging"
+
+    def __init__(
+        self,
+        colorscale: str = "RdBu",
+        midpoint=None,
+        n_colors: int | None = None,
+        vmin=None,
+        vmax=None,
+    ):
+        super().__init__(
+            colorscale=colorscale,
+            midpoint=midpoint,
+            n_colors=n_colors,
+            vmin=vmin,
+            vmax=vmax,
+        )
+
+    def to_style_conditions(self, output: str = "conditions"):
+        """
+        Generate the conditions of the scale, see `diverging`.
+
+        Parameters
+        ----------
+        output : {'conditions', 'function', 'classes'}, default 'conditions'
+            The kind of output, see `diverging`.
+        """
+        _check_output(output)
+        self._check_fitted()
+        vmin, vmax = self.params["vmin"], self.params["vmax"]
+        edges, styles = _diverging_bins(
+            *_diverging_range(self.min, self.max, vmin, vmax),
+            self.params["colorscale"],
+            self.params["midpoint"],
+            self.params["n_colors"],
+        )
+        _extend_edges(edges, self.min, self.max, vmin, vmax)
+        return _binned_styles(edges, styles, output)
+
+
+class QualitativeScale(_Scale):
+    """
+    A fitted `qualitative` scale.
+
+    The categories are sorted, unless all the data was categorical, in which
+    case they keep the order of its categories.
+
+    Parameters
+    ----------
+    colorscale, overflow
+        See `qualitative`.
+    """
+
+    kind = "qualitative"
+
+    def __init__(self, colorscale: str = "Vivid", overflow: str = "raise"):
+        super().__init__(colorscale=colorscale, overflow=overflow)
+
+    def reset(self):
+        super().reset()
+        self.categories = []
+        self._seen = set()
+        self._sort = False
+
+    def partial_fit(self, data):
+        categorical = isinstance(data, pd.Series) and isinstance(
+            data.dtype, pd.CategoricalDtype
+        )
+        self._sort = self._sort or not categorical
+        for category in _data.categories(data):
+            if category not in self._seen:
+                self._seen.add(category)
+                self.categories.append(_python(category))
+        values = _data.column(data)
+        self.count += _data.size(values)
+        self.missing += _data.count_missing(values)
+        return self
+
+    def _state(self):
+        return {
+            "count": self.count,
+            "missing": self.missing,
+            "categories": self._categories(),
+        }
+
+    def _set_state(self, state):
+        self.count = state["count"]
+        self.missing = state["missing"]
+        self.categories = list(state["categories"])
+        self._seen = set(self.categories)
+
+    def _categories(self):
+        if not self._sort:
+            return self.categories
+        try:
+            return sorted(self.categories)
+        except TypeError:
+            return self.categories
+
+    def to_style_conditions(self, output: str = "conditions"):
+        """
+        Generate the conditions of the scale, see `qualitative`.
+
+        Parameters
+        ----------
+        output : {'conditions', 'function', 'classes'}, default 'conditions'
+            The kind of output, see `qualitative`.
+        """
+        return _qualitative(
+            self._categories(),
+            self.params["colorscale"],
+            self.params["overflow"],
+            output,
+        )
+
+
+class BarScale(_Scale):
+    """
+    A fitted `bar` scale.
+
+    The distinct values are collected while there are no more than
+    `max_conditions` of them.
+
+    Parameters
+    ----------
+    bar_color, font_color, max_conditions
+        See `bar`.
+    """
+
+    kind = "bar"
+
+    def __init__(
+        self,
+        bar_color: str = "#efefef",
+        font_color: str = "inherit",
+        max_conditions: int | None = 100,
+    ):
+        super().__init__(
+            bar_color=bar_color, font_color=font_color, max_conditions=max_conditions
+        )
+
+    def reset(self):
+        super().reset()
+        self.distinct = set()
+
+    def _update(self, values):
+        if _data.size(values) and not _data.is_numeric(values):
+            raise ValueError("Series must be numeric to use style_bar.")
+        super()._update(values)
+        if self.distinct is not None:
+            max_conditions = self.params["max_conditions"]
+            if (
+                max_conditions is not None
+                and _data.nunique(values, limit=max_conditions) > max_conditions
+            ):
+                self.distinct = None
+                return
+            self.distinct.update(_data.unique(values))
+            if max_conditions is not None and len(self.distinct) > max_conditions:
+                self.distinct = None
+
+    def _state(self):
+        state = super()._state()
+        state["distinct"] = (
+            None if self.distinct is None else sorted(map(_python, self.distinct))
+        )
+        return state
+
+    def _set_state(self, state):
+        super()._set_state(state)
+        self.distinct = None if state["distinct"] is None else set(state["distinct"])
+
+    def to_style_conditions(self, output: str = "conditions"):
+        """
+        Generate the conditions of the scale, see `bar`.
+
+        Parameters
+        ----------
+        output : {'conditions', 'function', 'classes'}, default 'conditions'
+            The kind of output, see `bar`.
+        """
+        _check_output(output)
+        bar_color, font_color = self.params["bar_color"], self.params["font_color"]
+        if self.count == 0:
+            return _empty_bar(font_color, output)
+        return bar_from_stats(
+            self.min,
+            self.max,
+            bar_color,
+            font_color,
+            distinct=None if self.distinct is None else sorted(self.distinct),
+            max_conditions=self.params["max_conditions"],
+            output=output,
+        )
+
+
+def from_chunks(chunks, kind, column=None, output="conditions", **kwargs):
+    """
+    Generate the conditions of a scale from an iterable of chunks of data.
+
+    The statistics of the scale are updated chunk by chunk, so memory use is
+    bounded by the size of a chunk (and, for qualitative scales, by the
+    number of categories).
+
+    Parameters
+    ----------
+    chunks : iterable
+        The chunks, each any input accepted by the scale functions.
+    kind : {'sequential', 'diverging', 'qualitative', 'bar'}
+        The kind of scale.
+    column : str, optional
+        Read this column of each chunk, see `fit_chunks`.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        The kind of output, see the scale functions.
+    **kwargs
+        The parameters of the scale, see `SequentialScale`, `DivergingScale`,
+        `QualitativeScale` and `BarScale`.
+
+    Examples
+    --------
+    >>> chunks = pd.read_csv("sales.csv", usecols=["amount"], chunksize=1_000_000)
+    >>> das.from_chunks(chunks, "bar", column="amount")
+    """
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown scale '{kind}'.")
+    scale = _KINDS[kind](**kwargs).fit_chunks(chunks, column=column)
+    return scale.to_style_conditions(output)
@@ -1,10 +1,32 @@
+import functools
+import json
 import operator
+import zlib
 from itertools import pairwise
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 
-__all__ = ["sequential", "bar", "qualitative", "diverging"]
+from . import _data
+from ._binning import equal_width_edges
+from .cache import memoize
+from .css import class_rules
+from .instrumentation import instrument
+from .sketch import QuantileSketch
+
+__all__ = [
+    "sequential",
+    "bar",
+    "qualitative",
+    "diverging",
+    "sequential_from_stats",
+    "diverging_from_stats",
+    "bar_from_stats",
+    "style_frame",
+    "column_type",
+    "colorscale_cache_info",
+    "clear_colorscale_cache",
+]
 
 _DARK_SART_SCALES = [
     "plotly3",
@@ -46,17 +68,178 @@ _DARK_SART_SCALES = [
 ]
 
 
-def sequential(series: pd.Series, colorscale: str = "cividis"):
+@functools.lru_cache(maxsize=128)
+def _colorscale(colorscale, n_colors=None):
+    # Colors of a named continuous scale, resampled to `n_colors` steps if given.
+    # plotly.colors is imported on first use to keep `import dash_aggrid_scales` light.
+    from plotly import colors
+
+    scale = colors.get_colorscale(colorscale)
+    if n_colors is None:
+        return tuple(color for _, color in scale)
+    return tuple(colors.sample_colorscale(scale, n_colors))
+
+
+@functools.lru_cache(maxsize=128)
+def _qualitative_colorscale(colorscale):
+    from plotly import colors
+
+    return tuple(getattr(colors.qualitative, colorscale))
+
+
+def _resolve_colorscale(colorscale, n_colors=None):
+    try:
+        return _colorscale(colorscale, n_colors)
+    except ValueError:
+        raise ValueError(f"Color scale '{colorscale}' is not recognized.")
+
+
+def colorscale_cache_info():
+    """
+    Report hit/miss statistics of the resolved color scale caches.
+
+    Returns
+    -------
+    dict
+        The `functools.lru_cache` statistics of the continuous ('colorscale')
+        and qualitative ('qualitative') scale caches.
+    """
+    return {
+        "colorscale": _colorscale.cache_info(),
+        "qualitative": _qualitative_colorscale.cache_info(),
+    }
+
+
+def clear_colorscale_cache():
+    """Empty the resolved color scale caches and reset their statistics."""
+    _colorscale.cache_clear()
+    _qualitative_colorscale.cache_clear()
+
+
+def _check_output(output, allowed=("conditions", "function", "classes")):
+    if output not in allowed:
+        options = ", ".join(f"'{option}'" for option in allowed)
+        raise ValueError(f"output must be one of {options}, got '{output}'.")
+
+
+def _lookup_function(edges, styles):
+    """Build a JS expression that finds the bin of `params.value` by binary search.
+
+    `edges` are the sorted bin edges (one more than `styles`), and bins are
+    open on the left and closed on the right, like the generated conditions.
+    """
+
+    def search(lo, hi):
+        # Each leaf is the style of one bin, so a cell costs log2(bins)
+        # comparisons and creates a single object
+        if lo == hi:
+            return json.dumps(styles[lo])
+        mid = (lo + hi) // 2
+        return f"(params.value <= {edges[mid + 1]} ? {search(lo, mid)} : {search(mid + 1, hi)})"
+
+    return {
+        "function": f"params.value > {edges[0]} && params.value <= {edges[-1]} "
+        f"? {search(0, len(styles) - 1)} : null"
+    }
+
+
+def _binned_styles(edges, styles, output, counts=None):
+    # Conditions (or a lookup function) for bins open on the left and closed on
+    # the right. Empty bins, from repeated edges, are dropped. With the number
+    # of values in each bin, the conditions are sorted from the most populated
+    # bin, so that AG Grid finds the style of most cells after a few checks.
+    bins = [
+        (left, right, style)
+        for (left, right), style in zip(pairwise(edges), styles)
+        if right > left
+    ]
+    if not bins:
+        # The edges are NaN when the data has no valid value
+        raise ValueError("Cannot compute bins for a series without valid values.")
+    if output == "function":
+        edges = [bins[0][0]] + [right for _, right, _ in bins]
+        return _lookup_function(edges, [style for _, _, style in bins])
+    if counts is not None:
+        counts = [
+            count
+            for (left, right), count in zip(pairwise(edges), counts)
+            if right > left
+        ]
+        bins = [bins[i] for i in _by_count(counts)]
+    styleConditions = [
+        {
+            "condition": f"params.value > {left} && params.value <= {right}",
+            "style": style,
+        }
+        for left, right, style in bins
+    ]
+    if output == "classes":
+        return class_rules(styleConditions)
+    return styleConditions
+
+
+def _by_count(counts):
+    # Indices of `counts` from the largest count, keeping ties in order
+    return sorted(range(len(counts)), key=lambda i: -counts[i])
+
+
+def _check_order(order):
+    if order not in ("ascending", "frequency"):
+        raise ValueError(f"order must be 'ascending' or 'frequency', got '{order}'.")
+
+
+def _quantile_edges(quantiles):
+    edges = list(quantiles)
+    # Move the first edge just below the minimum so the first bin includes it
+    edges[0] = np.nextafter(edges[0], -np.inf)
+    return edges
+
+
+@instrument
+@memoize
+def sequential(
+    series: pd.Series,
+    colorscale: str = "cividis",
+    n_colors: int | None = None,
+    binning: str = "equal",
+    sketch_k: int = 200,
+    output: str = "conditions",
+    order: str = "ascending",
+):
     """
     Generates style conditions for a heatmap-like styling based on the values in a Pandas Series.
 
     Parameters
     ----------
-    series : pd.Series
-        Input data for generating color bins.
+    series : pd.Series or array-like
+        Input data for generating color bins. NumPy arrays, PyArrow arrays,
+        Polars Series and plain sequences are read without converting them
+        to pandas. With a DataFrame, or a list of columns, the scale is
+        computed over all of them, without concatenating them.
     colorscale : str, default 'cividis'
         Name of a Plotly Express colorscale. If it ends with '_r',
         the scale will reverse the midpoint logic.
+    n_colors : int, optional
+        Resample the color scale to this many colors (and bins). By default
+        the colors of the scale are used as they are.
+    binning : {'equal', 'quantile'}, default 'equal'
+        'equal' splits the range of the data into equal-width bins. 'quantile'
+        puts (approximately) the same number of values in each bin, which
+        spreads the colors on skewed data. The quantiles are estimated with a
+        streaming sketch, without sorting the data.
+    sketch_k : int, default 200
+        The accuracy of the quantile sketch, see `QuantileSketch`.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that finds the bin of each cell by
+        binary search, and can be used as the `cellStyle` of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+    order : {'ascending', 'frequency'}, default 'ascending'
+        The order of the conditions. AG Grid tests them in order until one
+        matches, so with 'frequency' they are sorted from the bin with the
+        most values, counted in one pass over the data, and most cells are
+        styled after fewer checks. Ignored with `output="function"`.
 
     Returns
     -------
@@ -64,37 +247,101 @@ def sequential(series: pd.Series, colorscale: str = "cividis"):
         A list of style condition dictionaries, each containing:
          - 'condition': the JS condition to compare cell values.
          - 'style': a dictionary with 'backgroundColor' and 'color'.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
     """
+    _check_output(output)
+    _check_order(order)
+    values = _data.column(series)
+    min_val, max_val = _data.min_max(values)
+    quantiles = None
+    if binning == "quantile":
+        num_bins = len(_resolve_colorscale(colorscale, n_colors))
+        sketch = QuantileSketch(sketch_k, seed=0).update(values)
+        quantiles = sketch.quantiles(np.linspace(0, 1, num_bins + 1))
+    elif binning != "equal":
+        raise ValueError(f"binning must be 'equal' or 'quantile', got '{binning}'.")
+    edges, styles = _sequential_bins(min_val, max_val, colorscale, n_colors, quantiles)
+    counts = None
+    if order == "frequency" and output != "function":
+        counts = _data.bin_counts(values, edges)
+    return _binned_styles(edges, styles, output, counts)
 
+
+def sequential_from_stats(
+    min_val,
+    max_val,
+    colorscale: str = "cividis",
+    n_colors: int | None = None,
+    quantiles=None,
+    output: str = "conditions",
+):
+    """
+    Generates the same style conditions as `sequential`, from summary statistics.
+
+    Useful when the data is not available in the Dash process, for example
+    with the server-side or infinite row models, where the minimum and
+    maximum can come from a single aggregate query.
+
+    Parameters
+    ----------
+    min_val, max_val : float
+        The minimum and maximum of the data.
+    colorscale : str, default 'cividis'
+        Name of a Plotly Express colorscale. If it ends with '_r',
+        the scale will reverse the midpoint logic.
+    n_colors : int, optional
+        Resample the color scale to this many colors (and bins). By default
+        the colors of the scale are used as they are.
+    quantiles : sequence of float, optional
+        The values of the data at evenly spaced quantiles, from the minimum to
+        the maximum, to use as bin edges instead of equal-width bins. The color
+        scale is resampled to `len(quantiles) - 1` colors if needed.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that finds the bin of each cell by
+        binary search, and can be used as the `cellStyle` of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+
+    Returns
+    -------
+    list of dict
+        A list of style condition dictionaries, each containing:
+         - 'condition': the JS condition to compare cell values.
+         - 'style': a dictionary with 'backgroundColor' and 'color'.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
+    """
+    _check_output(output)
+    edges, styles = _sequential_bins(min_val, max_val, colorscale, n_colors, quantiles)
+    return _binned_styles(edges, styles, output)
+
+
+def _sequential_bins(min_val, max_val, colorscale, n_colors, quantiles):
+    # The bin edges and the style of each bin of a sequential scale
     if colorscale.lower() in _DARK_SART_SCALES:
         comparator = operator.gt if colorscale.endswith("_r") else operator.lt
     else:
         comparator = operator.lt if colorscale.endswith("_r") else operator.gt
 
-    try:
-        scale = px.colors.get_colorscale(colorscale)
-    except ValueError:
-        raise ValueError(f"Color scale '{colorscale}' is not recognized.")
+    colors = _resolve_colorscale(colorscale, n_colors)
+    if quantiles is not None and len(colors) != len(quantiles) - 1:
+        colors = _resolve_colorscale(colorscale, len(quantiles) - 1)
 
-    num_bins = len(scale)
-    categories = pd.cut(
-        series, num_bins, include_lowest=True
-    ).cat.categories.sort_values()
+    num_bins = len(colors)
+    if quantiles is not None:
+        edges = _quantile_edges(quantiles)
+    else:
+        edges = equal_width_edges(min_val, max_val, num_bins)
 
     midpoint = num_bins / 2.0
 
-    styleConditions = []
-    for i, cat in enumerate(categories):
-        background_color = scale[i][1]
+    styles = []
+    for i in range(num_bins):
         text_color = "white" if comparator(i, midpoint) else "inherit"
-        styleConditions.append(
-            {
-                "condition": f"params.value > {cat.left} && params.value <= {cat.right}",
-                "style": {"backgroundColor": background_color, "color": text_color},
-            }
-        )
-
-    return styleConditions
+        styles.append({"backgroundColor": colors[i], "color": text_color})
+    return edges, styles
 
 
 def _edge_bins(num_bins):
@@ -107,17 +354,50 @@ def _edge_bins(num_bins):
     return d.get(num_bins, [0, 1, num_bins - 1, num_bins - 2])
 
 
-def diverging(series: pd.Series, colorscale: str = "RdBu", midpoint=None):
+@instrument
+@memoize
+def diverging(
+    series: pd.Series,
+    colorscale: str = "RdBu",
+    midpoint=None,
+    n_colors: int | None = None,
+    output: str = "conditions",
+    order: str = "ascending",
+    vmin=None,
+    vmax=None,
+):
     """
     Generates style conditions using a diverging color scale based on the values in a Pandas Series.
 
     Parameters
     ----------
-    series : pd.Series
-        Input data for generating color bins.
+    series : pd.Series or array-like
+        Input data for generating color bins. NumPy arrays, PyArrow arrays,
+        Polars Series and plain sequences are read without converting them
+        to pandas. With a DataFrame, or a list of columns, the scale is
+        computed over all of them, without concatenating them.
     colorscale : str, default 'RdBu'
         Name of a Plotly Express colorscale. If it ends with '_r',
         the scale will be reversed.
+    midpoint : float, optional
+        The value at the center of the color scale.
+    n_colors : int, optional
+        Resample the color scale to this many colors (and bins). By default
+        the colors of the scale are used as they are.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that finds the bin of each cell by
+        binary search, and can be used as the `cellStyle` of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+    order : {'ascending', 'frequency'}, default 'ascending'
+        The order of the conditions. AG Grid tests them in order until one
+        matches, so with 'frequency' they are sorted from the bin with the
+        most values, counted in one pass over the data, and most cells are
+        styled after fewer checks. Ignored with `output="function"`.
+    vmin, vmax : float, optional
+        The range of the color scale, instead of the minimum and maximum of
+        the data. Values beyond them get the colors of the ends of the scale.
 
     Returns
     -------
@@ -125,112 +405,491 @@ def diverging(series: pd.Series, colorscale: str = "RdBu", midpoint=None):
         A list of style condition dictionaries, each containing:
          - 'condition': the JS condition to compare cell values.
          - 'style': a dictionary with 'backgroundColor' and 'color'.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
     """
-    try:
-        scale = px.colors.get_colorscale(colorscale)
-    except ValueError:
-        raise ValueError(f"Color scale '{colorscale}' is not recognized.")
+    _check_output(output)
+    _check_order(order)
+    values = _data.column(series)
+    data_min, data_max = _data.min_max(values)
+    min_val, max_val = _diverging_range(data_min, data_max, vmin, vmax)
+    edges, styles = _diverging_bins(min_val, max_val, colorscale, midpoint, n_colors)
+    _extend_edges(edges, data_min, data_max, vmin, vmax)
+    counts = None
+    if order == "frequency" and output != "function":
+        counts = _data.bin_counts(values, edges)
+    return _binned_styles(edges, styles, output, counts)
+
+
+def _diverging_range(data_min, data_max, vmin, vmax):
+    # The range of the color scale: the data's, unless overridden
+    min_val = data_min if vmin is None else vmin
+    max_val = data_max if vmax is None else vmax
+    if (vmin is not None or vmax is not None) and min_val >= max_val:
+        raise ValueError(
+            f"vmin must be less than vmax, got a range from {min_val} to {max_val}."
+        )
+    return min_val, max_val
+
+
+def _extend_edges(edges, data_min, data_max, vmin, vmax):
+    # Extend the end bins to the values beyond `vmin` and `vmax`
+    if vmin is not None and data_min <= edges[0]:
+        edges[0] = np.nextafter(data_min, -np.inf)
+    if vmax is not None and data_max > edges[-1]:
+        edges[-1] = data_max
+
+
+def diverging_from_stats(
+    min_val,
+    max_val,
+    colorscale: str = "RdBu",
+    midpoint=None,
+    n_colors: int | None = None,
+    output: str = "conditions",
+    vmin=None,
+    vmax=None,
+):
+    """
+    Generates the same style conditions as `diverging`, from summary statistics.
+
+    Parameters
+    ----------
+    min_val, max_val : float
+        The minimum and maximum of the data.
+    colorscale : str, default 'RdBu'
+        Name of a Plotly Express colorscale. If it ends with '_r',
+        the scale will be reversed.
+    midpoint : float, optional
+        The value at the center of the color scale.
+    n_colors : int, optional
+        Resample the color scale to this many colors (and bins). By default
+        the colors of the scale are used as they are.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that finds the bin of each cell by
+        binary search, and can be used as the `cellStyle` of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+    vmin, vmax : float, optional
+        The range of the color scale, instead of `min_val` and `max_val`.
+        Values beyond them get the colors of the ends of the scale.
+
+    Returns
+    -------
+    list of dict
+        A list of style condition dictionaries, each containing:
+         - 'condition': the JS condition to compare cell values.
+         - 'style': a dictionary with 'backgroundColor' and 'color'.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
+    """
+    _check_output(output)
+    edges, styles = _diverging_bins(
+        *_diverging_range(min_val, max_val, vmin, vmax),
+        colorscale,
+        midpoint,
+        n_colors,
+    )
+    _extend_edges(edges, min_val, max_val, vmin, vmax)
+    return _binned_styles(edges, styles, output)
 
-    num_bins = len(scale)
-    mid_value = series.min() + ((series.max() - series.min()) / 2)
+
+def _diverging_bins(min_val, max_val, colorscale, midpoint, n_colors):
+    # The bin edges and the style of each bin of a diverging scale
+    colors = _resolve_colorscale(colorscale, n_colors)
+
+    num_bins = len(colors)
+    mid_value = min_val + ((max_val - min_val) / 2)
     if midpoint is not None:
+        # Stretch the range so that `midpoint` is at its center
         if midpoint <= mid_value:
-            newval = midpoint - (series.max() - midpoint)
+            min_val = min(min_val, midpoint - (max_val - midpoint))
         else:
-            newval = midpoint + (midpoint - series.min())
-        series = pd.concat([series, pd.Series([newval])])
-    categories = pd.cut(
-        series, num_bins, include_lowest=True
-    ).cat.categories.sort_values()
+            max_val = max(max_val, midpoint + (midpoint - min_val))
+    edges = equal_width_edges(min_val, max_val, num_bins)
 
-    styleConditions = []
-    for i, cat in enumerate(categories):
-        background_color = scale[i][1]
+    styles = []
+    for i in range(num_bins):
         text_color = "white" if i in _edge_bins(num_bins) else "inherit"
-        styleConditions.append(
-            {
-                "condition": f"params.value > {cat.left} && params.value <= {cat.right}",
-                "style": {"backgroundColor": background_color, "color": text_color},
-            }
-        )
-    return styleConditions
+        styles.append({"backgroundColor": colors[i], "color": text_color})
+    return edges, styles
+
+
+def _category_color(cat, position, scale):
+    # Categories that fit in the palette get their own color, the rest are
+    # assigned a palette color from a stable hash of their value.
+    if position < len(scale):
+        return scale[position]
+    return scale[zlib.crc32(str(cat).encode()) % len(scale)]
+
+
+def _js_key(cat):
+    # JS converts object keys to strings, so match how it prints numbers
+    if isinstance(cat, str):
+        return cat
+    if isinstance(cat, float) and cat.is_integer():
+        return str(int(cat))
+    if isinstance(cat, (bool, np.bool_)):
+        return str(cat).lower()
+    return str(cat)
 
 
-def qualitative(series: pd.Series, colorscale: str = "Vivid"):
+def _category_function(colors):
+    """Build a JS expression that finds the color of `params.value` by binary search.
+
+    `colors` maps the categories, as JS prints them, to their color. The value
+    is converted to a string and compared with the sorted keys, so a cell
+    costs log2(categories) comparisons instead of building a table of all the
+    colors on every evaluation.
+    """
+    # JS compares strings by UTF-16 code units
+    keys = sorted(colors, key=lambda key: key.encode("utf-16-be"))
+    value = 'params.value + ""'
+
+    def search(lo, hi):
+        if lo == hi:
+            style = json.dumps({"backgroundColor": colors[keys[lo]]})
+            return f"({value} === {json.dumps(keys[lo])} ? {style} : null)"
+        mid = (lo + hi) // 2
+        return f"({value} <= {json.dumps(keys[mid])} ? {search(lo, mid)} : {search(mid + 1, hi)})"
+
+    if not keys:
+        return {"function": "null"}
+    return {"function": search(0, len(keys) - 1)}
+
+
+@instrument
+@memoize
+def qualitative(
+    series: pd.Series,
+    colorscale: str = "Vivid",
+    overflow: str = "raise",
+    output: str = "conditions",
+):
     """
     Generates style conditions for categorical data in a Pandas Series.
 
     Parameters
     ----------
-    series : pd.Series
-        The categorical data.
+    series : pd.Series or array-like
+        The categorical data. NumPy arrays, PyArrow arrays, Polars Series and
+        plain sequences are read without converting them to pandas. With a
+        DataFrame, or a list of columns, the categories of all of them are
+        used.
     colorscale : str, default "Vivid"
         A key referencing a known qualitative color scale in Plotly.
+    overflow : {'raise', 'hash'}, default 'raise'
+        What to do when there are more categories than colors in the scale.
+        'raise' raises a ValueError, and 'hash' assigns the extra categories
+        a color from the scale, based on a deterministic hash of their value.
+    output : {'conditions', 'function', 'classes'}, default 'conditions'
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that finds the color of each cell with
+        a binary search over the categories, and can be used as the
+        `cellStyle` of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
 
     Returns
     -------
-    List[Dict[str, Any]]
+    List[Dict[str, Any]] or Dict[str, str]
         A list of dictionaries, each with:
          - 'condition': the JS expression for matching a cell's value
          - 'style': a dictionary specifying 'backgroundColor'
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
     """
-    scale = getattr(px.colors.qualitative, colorscale)
-    categories = series.astype("category").cat.categories
+    return _qualitative(_data.categories(series), colorscale, overflow, output)
+
+
+def _qualitative(categories, colorscale, overflow, output):
+    # Style conditions (or a lookup function) for known categories
+    _check_output(output)
+    if overflow not in ("raise", "hash"):
+        raise ValueError(f"overflow must be 'raise' or 'hash', got '{overflow}'.")
+    scale = _qualitative_colorscale(colorscale)
     styleConditions = []
 
-    if len(categories) > len(scale):
+    if len(categories) > len(scale) and overflow == "raise":
         raise ValueError(
             f"You have more categories than the colors in {colorscale}, please choose a different color scale."
         )
+    if output == "function":
+        colors = {
+            _js_key(cat): _category_color(cat, i, scale)
+            for i, cat in enumerate(categories)
+        }
+        return _category_function(colors)
+
     for i, cat in enumerate(categories):
         styleConditions.append(
             {
                 "condition": f"params.value === '{cat}'"
                 if isinstance(cat, str)
                 else f"params.value === {cat}",
-                "style": {"backgroundColor": scale[i]},
+                "style": {"backgroundColor": _category_color(cat, i, scale)},
             }
         )
+    if output == "classes":
+        return class_rules(styleConditions)
     return styleConditions
 
 
-def bar(series: pd.Series, bar_color: str = "#efefef", font_color: str = "inherit"):
+def _bar_distinct(values, max_conditions):
+    # The distinct values, if there are few enough of them to get one condition each
+    if (
+        max_conditions is None
+        or _data.nunique(values, limit=max_conditions) <= max_conditions
+    ):
+        return _data.unique(values)
+    return None
+
+
+def _bar_cutoffs(min_val, max_val, distinct, max_conditions):
+    # One interval per distinct value, unless they are unknown or there are more
+    # than `max_conditions`, in which case the range is split into equal-width buckets.
+    if distinct is not None and (
+        max_conditions is None or len(distinct) <= max_conditions
+    ):
+        cutoffs = list(distinct)
+        # Insert a value just below the smallest distinct value to define
+        # intervals. Beyond 2**53, subtracting 1 does not change the value.
+        lowest = cutoffs[0] - 1
+        if not lowest < cutoffs[0]:
+            lowest = np.nextafter(cutoffs[0], -np.inf)
+        cutoffs.insert(0, lowest)
+    else:
+        if max_conditions is None:
+            raise ValueError(
+                "max_conditions is required when the distinct values are not given."
+            )
+        cutoffs = np.linspace(min_val, max_val, max_conditions + 1).tolist()
+        # Move the first edge just below the minimum so the first bucket includes it
+        cutoffs[0] = np.nextafter(cutoffs[0], -np.inf)
+    return cutoffs
+
+
+def _empty_bar(font_color, output):
+    # The style of all the cells of an empty column
+    style = {"background": "white", "color": font_color}
+    if output == "function":
+        return {"function": f"({json.dumps(style)})"}
+    styleConditions = [{"condition": "true", "style": style}]  # Always match
+    if output == "classes":
+        return class_rules(styleConditions)
+    return styleConditions
+
+
+def _js_percent(fraction):
+    # JS expression that clamps `fraction` to [0, 1] and formats it as a percentage
+    return f"(Math.min(Math.max({fraction}, 0), 1) * 100).toFixed(2) + '%'"
+
+
+def _js_concat(*parts):
+    # Join string literals and (pre-wrapped) JS expressions with `+`
+    return " + ".join(
+        part[0] if isinstance(part, tuple) else json.dumps(part) for part in parts
+    )
+
+
+def _bar_function(min_val, max_val, bar_color, font_color):
+    color = json.dumps(font_color)
+    full_bar = json.dumps(f"linear-gradient(90deg, {bar_color} 0%, {bar_color} 100%)")
+    if min_val < 0:
+        range_val = max_val - min_val
+        if range_val == 0:
+            return {"function": f"({{background: {full_bar}, color: {color}}})"}
+        zero_pos = (0 - min_val) / range_val
+        fraction = f"(params.value - {min_val}) / {range_val}"
+        start = (_js_percent(f"Math.min({zero_pos}, {fraction})"),)
+        end = (_js_percent(f"Math.max({zero_pos}, {fraction})"),)
+        background = _js_concat(
+            "linear-gradient(90deg, white 0%, white ",
+            start,
+            f", {bar_color} ",
+            start,
+            f", {bar_color} ",
+            end,
+            ", white ",
+            end,
+            ", white 100%)",
+        )
+    else:
+        if max_val == 0:
+            return {"function": f"({{background: {full_bar}, color: {color}}})"}
+        end = (_js_percent(f"params.value / {max_val}"),)
+        background = _js_concat(
+            f"linear-gradient(90deg, {bar_color} 0%, {bar_color} ",
+            end,
+            ", white ",
+            end,
+            ", white 100%)",
+        )
+    return {
+        "function": f"params.value == null ? null : ({{background: {background}, color: {color}}})"
+    }
+
+
+@instrument
+@memoize
+def bar(
+    series: pd.Series,
+    bar_color: str = "#efefef",
+    font_color: str = "inherit",
+    max_conditions: int | None = 100,
+    output: str = "conditions",
+    order: str = "ascending",
+):
     """
     Generates style conditions that visualize a horizontal 'bar fill' effect
     based on the value in `series`. Bar widths are scaled as a percentage
     of the maximum value in the series. Negative values are clamped to 0% fill.
 
+    One condition is created per distinct value. When the series has more
+    distinct values than `max_conditions`, the bar widths are quantized into
+    `max_conditions` equal-width buckets instead, so the number of conditions
+    does not grow with the cardinality of the column.
+
+    With `output="function"` a single JS function is returned instead, which
+    computes the bar in the browser from `params.value`. Its size and the
+    cost of evaluating it per cell are constant, regardless of the data.
+
     Parameters
     ----------
-    series : pd.Series
-        Numeric data representing the values to visualize.
+    series : pd.Series or array-like
+        Numeric data representing the values to visualize. NumPy arrays,
+        PyArrow arrays, Polars Series and plain sequences are read without
+        converting them to pandas. With a DataFrame, or a list of columns,
+        the bars share the range of all of them.
     bar_color : str, optional (default: '#efefef')
         The color to use for the filled portion of the bar.
     font_color : str, optional (default: 'inherit')
         The text color used when rendering the cell contents.
+    max_conditions : int or None, optional (default: 100)
+        The maximum number of conditions to generate. Set to None to always
+        create one condition per distinct value.
+    output : {'conditions', 'function', 'classes'}, optional (default: 'conditions')
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that can be used as the `cellStyle`
+        of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+    order : {'ascending', 'frequency'}, optional (default: 'ascending')
+        The order of the conditions. AG Grid tests them in order until one
+        matches, so with 'frequency' they are sorted from the interval with
+        the most values, and most cells are styled after fewer checks.
+        Ignored with `output="function"`.
 
     Returns
     -------
-    List[Dict[str, Dict[str, str]]]
+    List[Dict[str, Dict[str, str]]] or Dict[str, str]
         A list of style condition dictionaries. Each dictionary has:
           - 'condition': A JS expression (as a string) that checks if
             the cell's value is between two boundaries.
           - 'style': A dictionary with CSS properties such as
             'background' and 'color'.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
     """
-    if series.empty:
-        return [
-            {
-                "condition": "true",  # Always match
-                "style": {"background": "white", "color": font_color},
-            }
-        ]
+    _check_output(output)
+    _check_order(order)
+    values = _data.column(series)
+    if _data.size(values) == 0:
+        return _empty_bar(font_color, output)
 
-    if not pd.api.types.is_numeric_dtype(series):
+    if not _data.is_numeric(values):
         raise ValueError("Series must be numeric to use style_bar.")
-    if series.lt(0).any():
-        min_val = series.min()
-        max_val = series.max()
+    min_val, max_val = _data.min_max(values)
+    distinct = _bar_distinct(values, max_conditions) if output != "function" else None
+    if order == "ascending" or output == "function":
+        return bar_from_stats(
+            min_val,
+            max_val,
+            bar_color,
+            font_color,
+            distinct=distinct,
+            max_conditions=max_conditions,
+            output=output,
+        )
+
+    styleConditions = bar_from_stats(
+        min_val,
+        max_val,
+        bar_color,
+        font_color,
+        distinct=distinct,
+        max_conditions=max_conditions,
+    )
+    if len(styleConditions) > 1:
+        # One condition per interval between the cutoffs
+        cutoffs = _bar_cutoffs(min_val, max_val, distinct, max_conditions)
+        counts = _data.bin_counts(values, cutoffs)
+        styleConditions = [styleConditions[i] for i in _by_count(counts)]
+    if output == "classes":
+        return class_rules(styleConditions)
+    return styleConditions
+
+
+def bar_from_stats(
+    min_val,
+    max_val,
+    bar_color: str = "#efefef",
+    font_color: str = "inherit",
+    distinct=None,
+    max_conditions: int | None = 100,
+    output: str = "conditions",
+):
+    """
+    Generates the same style conditions as `bar`, from summary statistics.
+
+    Without the distinct values of the data, the bar widths are quantized
+    into `max_conditions` equal-width buckets, which is what `bar` does for
+    columns with more than `max_conditions` distinct values.
+
+    Parameters
+    ----------
+    min_val, max_val : float
+        The minimum and maximum of the data, NaN if all the values are
+        missing (every cell is then left without a bar).
+    bar_color : str, optional (default: '#efefef')
+        The color to use for the filled portion of the bar.
+    font_color : str, optional (default: 'inherit')
+        The text color used when rendering the cell contents.
+    distinct : sequence of float, optional
+        The sorted distinct values of the data. If given, and there are not
+        more than `max_conditions` of them, one condition is created per value.
+    max_conditions : int or None, optional (default: 100)
+        The maximum number of conditions to generate. It can only be None
+        when `distinct` is given.
+    output : {'conditions', 'function', 'classes'}, optional (default: 'conditions')
+        Whether to return a list of style conditions, or a single
+        `{"function": ...}` expression that can be used as the `cellStyle`
+        of a column.
+        'classes' returns `cellClassRules` pointing at CSS classes, see
+        `stylesheet`.
+
+    Returns
+    -------
+    List[Dict[str, Dict[str, str]]] or Dict[str, str]
+        A list of style condition dictionaries, as returned by `bar`.
+        With `output="function"`, a dictionary with a 'function' key, and
+        with `output="classes"`, a dictionary of class names and conditions.
+    """
+    _check_output(output)
+    if pd.isna(min_val):
+        # Only missing values
+        return _empty_bar(font_color, output)
+    if output == "function":
+        return _bar_function(min_val, max_val, bar_color, font_color)
+    if output == "classes":
+        return class_rules(
+            bar_from_stats(
+                min_val, max_val, bar_color, font_color, distinct, max_conditions
+            )
+        )
+
+    if min_val < 0:
         range_val = max_val - min_val
         if range_val == 0:
             return [
@@ -244,12 +903,11 @@ def bar(series: pd.Series, bar_color: str = "#efefef", font_color: str = "inheri
             ]
         zero_pos = (0 - min_val) / range_val
 
-        distinct_vals = series.drop_duplicates().sort_values().tolist()
-        distinct_vals.insert(0, distinct_vals[0] - 1)
+        cutoffs = _bar_cutoffs(min_val, max_val, distinct, max_conditions)
 
         styleConditions = []
 
-        for lower, upper in pairwise(distinct_vals):
+        for lower, upper in pairwise(cutoffs):
             fraction = (upper - min_val) / range_val
 
             start = min(zero_pos, fraction)
@@ -280,8 +938,6 @@ def bar(series: pd.Series, bar_color: str = "#efefef", font_color: str = "inheri
 
         return styleConditions
     else:
-        max_val = series.max()
-
         # Handle the edge case where all values are the same or max_val == 0
         # (i.e., 0% would always occur). We'll just show full fill in that case.
         if max_val == 0:
@@ -295,14 +951,12 @@ def bar(series: pd.Series, bar_color: str = "#efefef", font_color: str = "inheri
                 }
             ]
 
-        # Prepare distinct cutoff points
-        distinct_vals = series.drop_duplicates().sort_values().tolist()
-        # Insert a value just below the smallest distinct value to define intervals
-        distinct_vals.insert(0, distinct_vals[0] - 1)
+        # Prepare cutoff points (distinct values or bucket edges)
+        cutoffs = _bar_cutoffs(min_val, max_val, distinct, max_conditions)
 
         styleConditions = []
 
-        for lower, upper in pairwise(distinct_vals):
+        for lower, upper in pairwise(cutoffs):
             # Fraction of max_val (clamp to [0,1])
             fraction = upper / max_val
             fraction = max(0.0, min(1.0, fraction))
@@ -333,9 +987,190 @@ def style_column(series, typ, **kwargs):
     match typ:
         case typ if typ == "sequential":
             return sequential(series, **kwargs)
+        case typ if typ == "diverging":
+            return diverging(series, **kwargs)
         case typ if typ == "qualitative":
-            return sequential(series, **kwargs)
+            return qualitative(series, **kwargs)
         case typ if typ == "bar":
             return bar(series, **kwargs)
         case _:
             return None
+
+
+_SCALE_TYPES = ("sequential", "diverging", "qualitative", "bar")
+
+
+def column_type(result):
+    """
+    Wrap the output of a scale function in the properties of an AgGrid column.
+
+    A scale computed once for several columns, for example with
+    `diverging(df[columns])`, can be defined as a column type of the grid,
+    so that its conditions are sent once instead of once per column.
+
+    Parameters
+    ----------
+    result : list or dict
+        The output of a scale function, with any `output`.
+
+    Returns
+    -------
+    dict
+        A 'cellStyle' for style conditions and functions, or 'cellClassRules'
+        for classes.
+
+    Examples
+    --------
+    >>> AgGrid(
+    ...     columnDefs=[{"field": col, "type": "change"} for col in columns],
+    ...     dashGridOptions={
+    ...         "columnTypes": {"change": das.column_type(das.diverging(df[columns]))}
+    ...     },
+    ... )
+    """
+    if isinstance(result, list):
+        return {"cellStyle": {"styleConditions": result}}
+    if "function" in result:
+        return {"cellStyle": result}
+    return {"cellClassRules": result}
+
+
+def _stats_kwargs(kwargs):
+    # The arguments of a scale function, without those about reading the data
+    # that the `*_from_stats` functions do not take
+    return {
+        key: value
+        for key, value in kwargs.items()
+        if key not in ("binning", "sketch_k", "order")
+    }
+
+
+def style_frame(
+    df: pd.DataFrame,
+    spec,
+    max_workers: int | None = None,
+    executor: str = "auto",
+    chunksize: int | None = None,
+):
+    """
+    Generates the `columnDefs` of an AgGrid, styling several columns of a DataFrame at once.
+
+    The minimum and maximum of all the numeric columns to style are computed
+    together, with one `min()` and one `max()` over the DataFrame. Columns
+    that are styled more than once (for example as `sequential` and as `bar`)
+    share their statistics.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The data of the grid.
+    spec : list of str or dict
+        One column definition per column of the grid. Strings are the fields
+        of columns without a scale. Dicts are AgGrid column definitions with a
+        'field', and optionally:
+         - 'scale': one of 'sequential', 'diverging', 'qualitative' or 'bar'.
+         - 'scale_kwargs': a dict of keyword arguments for the scale function.
+    max_workers : int, optional
+        Style the columns concurrently with this many workers. By default
+        they are styled one after the other.
+    executor : {'auto', 'process', 'thread'}, default 'auto'
+        The kind of workers. With processes, numeric columns are passed to the
+        workers through shared memory instead of being pickled. 'auto' uses
+        threads on free-threaded Python builds, and processes otherwise.
+    chunksize : int, optional
+        The number of columns styled by each task. By default the columns are
+        split in about four tasks per worker.
+
+    Returns
+    -------
+    list of dict
+        The column definitions, with a 'cellStyle' for each styled column, or
+        'cellClassRules' for those with `output="classes"`.
+
+    Examples
+    --------
+    >>> style_frame(
+    ...     medals,
+    ...     [
+    ...         {"field": "nation", "scale": "qualitative"},
+    ...         {"field": "count", "scale": "sequential"},
+    ...         {"field": "count", "scale": "bar", "scale_kwargs": {"bar_color": "teal"}},
+    ...     ],
+    ... )
+    """
+    spec = [{"field": item} if isinstance(item, str) else item for item in spec]
+    for item in spec:
+        if item.get("scale") not in (None, *_SCALE_TYPES):
+            raise ValueError(f"Unknown scale '{item['scale']}' for '{item['field']}'.")
+    if max_workers is not None and max_workers > 1:
+        from ._parallel import style_frame_parallel
+
+        return style_frame_parallel(df, spec, max_workers, executor, chunksize)
+
+    styled = dict.fromkeys(item["field"] for item in spec if item.get("scale"))
+    numeric = [
+        field for field in styled if pd.api.types.is_numeric_dtype(df[field].dtype)
+    ]
+    if len(df):
+        mins = df[numeric].min().to_dict()
+        maxs = df[numeric].max().to_dict()
+    else:
+        mins = maxs = {}
+    categories = {}
+    distinct = {}
+
+    columnDefs = []
+    for item in spec:
+        columnDef = {
+            key: value
+            for key, value in item.items()
+            if key not in ("scale", "scale_kwargs")
+        }
+        scale = item.get("scale")
+        field = item["field"]
+        kwargs = item.get("scale_kwargs", {})
+        if scale is None:
+            columnDefs.append(columnDef)
+            continue
+        if scale == "qualitative":
+            if field not in categories:
+                categories[field] = _data.categories(df[field])
+            result = _qualitative(
+                categories[field],
+                **{
+                    "colorscale": "Vivid",
+                    "overflow": "raise",
+                    "output": "conditions",
+                    **kwargs,
+                },
+            )
+        elif (
+            field not in mins
+            or kwargs.get("binning", "equal") != "equal"
+            or kwargs.get("order", "ascending") != "ascending"
+        ):
+            # Empty or non-numeric columns, quantile bins and conditions
+            # ordered by frequency need the data
+            result = style_column(df[field], scale, **kwargs)
+        elif scale == "sequential":
+            result = sequential_from_stats(
+                mins[field], maxs[field], **_stats_kwargs(kwargs)
+            )
+        elif scale == "diverging":
+            result = diverging_from_stats(
+                mins[field], maxs[field], **_stats_kwargs(kwargs)
+            )
+        else:
+            kwargs = _stats_kwargs(kwargs)
+            max_conditions = kwargs.get("max_conditions", 100)
+            if kwargs.get("output", "conditions") != "function":
+                key = (field, max_conditions)
+                if key not in distinct:
+                    distinct[key] = _bar_distinct(
+                        _data.column(df[field]), max_conditions
+                    )
+                kwargs = {**kwargs, "distinct": distinct[key]}
+            result = bar_from_stats(mins[field], maxs[field], **kwargs)
+        columnDef.update(column_type(result))
+        columnDefs.append(columnDef)
+    return columnDefs
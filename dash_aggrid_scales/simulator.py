@@ -0,0 +1,185 @@
+"""
+Replay the evaluation of style conditions, as AG Grid does it in the browser.
+
+AG Grid tests the `styleConditions` of a column in order, for every rendered
+cell, and applies the style of the first one that matches. `simulate` parses
+the conditions generated by this package and evaluates them over the data
+with NumPy, to measure how many conditions are tested per cell, and to check
+that every value is styled by exactly one condition.
+
+    >>> report = das.simulate(das.sequential(df["pop"]), df["pop"])
+    >>> report["mean_checks"], report["unstyled"], report["overlaps"]
+"""
+
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+
+from . import _data
+
+_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+_COMPARISON = re.compile(r"params\.value\s*(===|!==|==|!=|>=|<=|>|<)\s*(.+)")
+
+
+def _literal(text):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    if text in ("true", "false"):
+        return text == "true"
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Unsupported value in condition: {text}") from None
+
+
+def _strip_parentheses(text):
+    text = text.strip()
+    while text.startswith("(") and text.endswith(")"):
+        text = text[1:-1].strip()
+    return text
+
+
+def parse_condition(condition):
+    """
+    Parse a condition generated by the scale functions.
+
+    Supported conditions are `true`, and comparisons of `params.value` with
+    numbers, strings and booleans, combined with `&&` and then `||`.
+
+    Parameters
+    ----------
+    condition : str
+        The JS condition.
+
+    Returns
+    -------
+    list of list of tuple
+        The alternatives of the condition (joined with `||`), each a list of
+        `(operator, value)` comparisons that must all be true. `true` is an
+        empty list of comparisons.
+    """
+    alternatives = []
+    for alternative in condition.split("||"):
+        comparisons = []
+        for part in _strip_parentheses(alternative).split("&&"):
+            part = _strip_parentheses(part)
+            if part == "true":
+                continue
+            match = _COMPARISON.fullmatch(part)
+            if match is None:
+                raise ValueError(f"Unsupported condition: {condition}")
+            comparisons.append((match.group(1), _literal(match.group(2))))
+        alternatives.append(comparisons)
+    return alternatives
+
+
+def _values(data):
+    # The values as a NumPy array, with the missing values as None or NaN
+    values = _data.column(data)
+    if isinstance(values, list):
+        return np.concatenate([_values(item) for item in values])
+    if _data._is_arrow(values):
+        values = values.to_numpy(zero_copy_only=False)
+    return np.ravel(values)
+
+
+def _compare(values, missing, op, value):
+    # Vectorized `params.value <op> value`, with the missing values sent as
+    # null: null is never equal to a value, and is 0 in inequalities.
+    if op in ("===", "==", "!==", "!="):
+        if values.dtype != object and (
+            isinstance(value, str) or isinstance(value, bool) != (values.dtype == bool)
+        ):
+            result = np.zeros(len(values), dtype=bool)
+        else:
+            result = (values == value) & ~missing
+        return ~result if op in ("!==", "!=") else result
+    if isinstance(value, str):
+        raise TypeError("Inequalities are only supported for numbers.")
+    values = np.where(missing, 0, values).astype("float64")
+    return _OPERATORS[op](values, value)
+
+
+def _evaluate(condition, values, missing):
+    result = np.zeros(len(values), dtype=bool)
+    for comparisons in parse_condition(condition):
+        matches = np.ones(len(values), dtype=bool)
+        for op, value in comparisons:
+            matches &= _compare(values, missing, op, value)
+        result |= matches
+    return result
+
+
+def simulate(styles, data):
+    """
+    Evaluate style conditions over `data`, the way AG Grid does.
+
+    Parameters
+    ----------
+    styles : list of dict or dict
+        Style conditions as returned by the scale functions, a `cellStyle`
+        dictionary with 'styleConditions', or `cellClassRules` (as returned
+        with `output="classes"`), where every rule is evaluated for every cell.
+    data : pd.Series or array-like
+        The values of the column.
+
+    Returns
+    -------
+    dict
+        - 'cells': the number of values.
+        - 'conditions': the number of conditions.
+        - 'mean_checks', 'p99_checks', 'max_checks': the number of conditions
+          evaluated per cell, on average, at the 99th percentile and at most.
+        - 'unstyled': the number of non-missing values that match no
+          condition (gaps).
+        - 'overlaps': the number of values that match more than one
+          condition. Only the first one applies to them, which usually means
+          that the conditions are not what was intended.
+        - 'matches': the number of values styled by each condition.
+    """
+    first_match = True
+    if isinstance(styles, dict):
+        if "styleConditions" in styles:
+            styles = styles["styleConditions"]
+        elif "function" in styles:
+            raise ValueError("JS functions can't be simulated.")
+        else:
+            first_match = False
+            styles = [
+                {"condition": condition, "style": name}
+                for name, condition in styles.items()
+            ]
+    values = _values(data)
+    missing = pd.isna(values)
+
+    checks = np.zeros(len(values), dtype=np.int64)
+    styled = np.zeros(len(values), dtype=bool)
+    n_matches = np.zeros(len(values), dtype=np.int64)
+    matches = []
+    for item in styles:
+        result = _evaluate(item["condition"], values, missing)
+        checks += ~styled if first_match else 1
+        matches.append(
+            int((result & ~styled).sum()) if first_match else int(result.sum())
+        )
+        n_matches += result
+        styled |= result
+
+    return {
+        "cells": len(values),
+        "conditions": len(styles),
+        "mean_checks": float(checks.mean()) if len(values) else 0.0,
+        "p99_checks": float(np.percentile(checks, 99)) if len(values) else 0.0,
+        "max_checks": int(checks.max()) if len(values) else 0,
+        "unstyled": int((~styled & ~missing).sum()),
+        "overlaps": int((n_matches > 1).sum()),
+        "matches": matches,
+    }
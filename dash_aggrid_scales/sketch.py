@@ -0,0 +1,194 @@
+"""A mergeable streaming sketch for approximate quantiles."""
+
+import math
+
+import numpy as np
+
+from . import _data
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream of numbers, with bounded memory (KLL sketch).
+
+    Values are kept in a hierarchy of buffers ("compactors"). When a buffer is
+    full, it is sorted and every other value is promoted to the next level,
+    where each value stands for twice as many inputs. Memory use depends on
+    `k` and grows only logarithmically with the number of values.
+
+    Sketches built from different chunks of data, possibly in different
+    processes (sketches can be pickled), can be combined with `merge`.
+
+    Parameters
+    ----------
+    k : int, default 200
+        Controls the size, and accuracy, of the sketch. The rank error of the
+        quantiles is inversely proportional to `k`, about 1.3% of the number
+        of values for the default of 200.
+    seed : int, optional
+        Seed for the random choices made when compacting the buffers.
+
+    Examples
+    --------
+    >>> sketch = QuantileSketch()
+    >>> for chunk in chunks:
+    ...     sketch.update(chunk)
+    >>> sketch.quantiles([0, 0.5, 1])
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.min = math.nan
+        self.max = math.nan
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        # Lower levels have smaller buffers, decreasing geometrically by 2/3
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep an odd item out, and promote every other one of the rest
+                keep = len(items) % 2
+                promoted = items[keep + self._rng.integers(2) :: 2]
+                self._levels[level] = items[:keep]
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+            level += 1
+
+    def update(self, values):
+        """
+        Add `values` to the sketch, ignoring NaNs and nulls.
+
+        Parameters
+        ----------
+        values : pd.Series or array-like
+            Numeric data, read in chunks so that only one chunk at a time
+            is copied.
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch itself.
+        """
+        for chunk in _data.chunks(_data.column(values)):
+            chunk = chunk[~np.isnan(chunk)]
+            if len(chunk) == 0:
+                continue
+            self.count += len(chunk)
+            self.min = np.fmin(self.min, chunk.min())
+            self.max = np.fmax(self.max, chunk.max())
+            self._levels[0] = np.concatenate([self._levels[0], chunk])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Add the values summarized by another sketch to this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            A sketch, typically built from another chunk of the same data.
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch itself.
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantiles(self, q):
+        """
+        Estimate the values of the data at the quantiles `q`.
+
+        Parameters
+        ----------
+        q : sequence of float
+            Quantiles between 0 and 1. The 0 and 1 quantiles are the exact
+            minimum and maximum.
+
+        Returns
+        -------
+        list of float
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(items), 2**level) for level, items in enumerate(self._levels)]
+        )
+        order = np.argsort(items)
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+        q = np.asarray(q, dtype="float64")
+        positions = np.searchsorted(ranks, q * ranks[-1], side="left")
+        values = items[np.minimum(positions, len(items) - 1)]
+        values = np.where(q <= 0, self.min, values)
+        values = np.where(q >= 1, self.max, values)
+        return values.tolist()
+
+    def to_dict(self):
+        """
+        Get the state of the sketch as a JSON-serializable dict.
+
+        Returns
+        -------
+        dict
+            The parameters, summary statistics and buffers of the sketch.
+        """
+        return {
+            "k": self.k,
+            "count": self.count,
+            "min": float(self.min),
+            "max": float(self.max),
+            "levels": [items.tolist() for items in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state, seed=None):
+        """
+        Rebuild a sketch from the output of `to_dict`.
+
+        Parameters
+        ----------
+        state : dict
+            The state of a sketch.
+        seed : int, optional
+            Seed for the random choices of the rebuilt sketch.
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        sketch = cls(state["k"], seed=seed)
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch._levels = [
+            np.asarray(items, dtype="float64") for items in state["levels"]
+        ]
+        return sketch
+
+    def __len__(self):
+        return self.count
@@ -17,7 +17,6 @@ medals = px.data.medals_long().assign(negative=list(range(-5, 4)))
 iris = px.data.iris()
 gapminder = px.data.gapminder()
 stocks = px.data.stocks()
-stock_changes = stock_changes = px.data.stocks().iloc[:, 1:].melt()["value"]
 
 defaultColDef = {
     "filter": True,
@@ -115,45 +114,36 @@ gapminder_grid = AgGrid(
     columnSize="responsiveSizeToFit",
     dashGridOptions={"rowHeight": 28, "dataTypeDefinitions": dataTypeDefinitions},
     defaultColDef=defaultColDef,
-    columnDefs=[
-        {
-            "field": "country",
-        },
-        {
-            "field": "continent",
-            "cellStyle": {"styleConditions": das.qualitative(gapminder["continent"])},
-        },
-        {
-            "field": "year",
-            "cellStyle": {
-                "styleConditions": das.sequential(gapminder["year"], "Plotly3")
+    columnDefs=das.style_frame(
+        gapminder,
+        [
+            {"field": "country"},
+            {"field": "continent", "scale": "qualitative"},
+            {
+                "field": "year",
+                "scale": "sequential",
+                "scale_kwargs": {"colorscale": "Plotly3"},
             },
-        },
-        {
-            "field": "lifeExp",
-            "valueFormatter": {"function": "d3.format('.1f')(params.value)"},
-            "cellStyle": {
-                "styleConditions": das.bar(gapminder["lifeExp"], "lightgray")
+            {
+                "field": "lifeExp",
+                "valueFormatter": {"function": "d3.format('.1f')(params.value)"},
+                "scale": "bar",
+                "scale_kwargs": {"bar_color": "lightgray"},
             },
-        },
-        {
-            "field": "pop",
-            "valueFormatter": {"function": "d3.format('>.3s')(params.value)"},
-            "cellStyle": {
-                "styleConditions": das.sequential(gapminder["pop"], "cividis")
+            {
+                "field": "pop",
+                "valueFormatter": {"function": "d3.format('>.3s')(params.value)"},
+                "scale": "sequential",
+                "scale_kwargs": {"colorscale": "cividis", "binning": "quantile"},
             },
-        },
-        {
-            "field": "gdpPercap",
-            "valueFormatter": {"function": "d3.format('.2s')(params.value)"},
-            "cellStyle": {
-                "styleConditions": das.bar(
-                    gapminder["gdpPercap"],
-                    "tan",
-                )
+            {
+                "field": "gdpPercap",
+                "valueFormatter": {"function": "d3.format('.2s')(params.value)"},
+                "scale": "bar",
+                "scale_kwargs": {"bar_color": "tan"},
             },
-        },
-    ],
+        ],
+    ),
 )
 
 stocks_grid = AgGrid(
@@ -161,23 +151,25 @@ stocks_grid = AgGrid(
     defaultColDef=defaultColDef,
     columnSize="responsiveSizeToFit",
     rowStyle={"font-size": "0.75rem"},
-    dashGridOptions={"rowHeight": 20},
+    dashGridOptions={
+        "rowHeight": 20,
+        # One scale shared by all the stocks, sent once
+        "columnTypes": {
+            "stockChange": {
+                "valueFormatter": {"function": "d3.format(',.2%')(params.value)"},
+                **das.column_type(
+                    das.diverging(stocks.iloc[:, 1:], "RdBu", midpoint=1)
+                ),
+            }
+        },
+    },
     style={"height": 650},
     columnDefs=[
         {
             "field": "date",
         }
     ]
-    + [
-        {
-            "field": col,
-            "valueFormatter": {"function": "d3.format(',.2%')(params.value)"},
-            "cellStyle": {
-                "styleConditions": das.diverging(stock_changes, "RdBu", midpoint=1)
-            },
-        }
-        for col in stocks.columns[1:]
-    ],
+    + [{"field": col, "type": "stockChange"} for col in stocks.columns[1:]],
 )
 
 
@@ -427,5 +419,4 @@ This will produce the required list of conditions that you can feed into the `Ag
     ],
     class_name="dbc dbc-ag-grid",
     fluid=True,
-
 )
@@ -0,0 +1,54 @@
+"""`_data.column` returns the values of its input without copying them."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dash_aggrid_scales import _data
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _address(values):
+    # The address of the data buffer of a PyArrow array
+    if isinstance(values, pa.ChunkedArray):
+        assert values.num_chunks == 1
+        values = values.chunk(0)
+    return values.buffers()[1].address
+
+
+def test_numpy():
+    array = np.arange(10.0)
+    assert np.shares_memory(_data.column(array), array)
+
+
+def test_numpy_backed_pandas():
+    array = np.arange(10.0)
+    assert np.shares_memory(_data.column(pd.Series(array, copy=False)), array)
+
+
+def test_pyarrow():
+    array = pa.array(np.arange(10.0))
+    assert _address(_data.column(array)) == _address(array)
+    chunked = pa.chunked_array([array])
+    assert _address(_data.column(chunked)) == _address(array)
+
+
+def test_arrow_backed_pandas():
+    array = pa.array(np.arange(10.0))
+    series = pd.Series(pd.arrays.ArrowExtensionArray(array))
+    assert _address(_data.column(series)) == _address(array)
+
+
+def test_polars():
+    pl = pytest.importorskip("polars")
+    array = pa.array(np.arange(10.0))
+    assert _address(_data.column(pl.from_arrow(array))) == _address(array)
+
+
+def test_several_columns():
+    first, second = np.arange(10.0), np.arange(10.0, 20.0)
+    frame = pd.DataFrame({"a": first, "b": second}, copy=False)
+    values = _data.column(frame)
+    assert len(values) == 2
+    assert all(np.shares_memory(*pair) for pair in zip(values, (first, second)))